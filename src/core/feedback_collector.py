@@ -4,8 +4,8 @@
 """
 
 from typing import Dict, List, Any, Optional, Tuple
+import logging
 import threading
-import queue
 
 try:
     # 尝试相对导入
@@ -16,38 +16,63 @@ except ImportError:
     from core.image_handler import ImageHandler
     from utils.i18n import get_text
 
+logger = logging.getLogger(__name__)
+
 
 class FeedbackData:
     """反馈数据模型"""
 
+    __slots__ = ('text_feedback', 'images')
+
+    # 最大图片数量
+    MAX_IMAGES = 10
+
     def __init__(self):
         self.text_feedback: Optional[str] = None
         self.images: List[Dict[str, Any]] = []
-        self.has_text: bool = False
-        self.has_images: bool = False
+
+    @property
+    def has_text(self) -> bool:
+        """是否包含文字反馈"""
+        return bool(self.text_feedback)
+
+    @property
+    def has_images(self) -> bool:
+        """是否包含图片"""
+        return bool(self.images)
 
     def add_text_feedback(self, text: str):
         """添加文字反馈"""
         if text and text.strip():
             self.text_feedback = text.strip()
-            self.has_text = True
 
-    def add_image(self, image_data: Dict[str, Any]):
-        """添加图片"""
+    def add_image(self, image_data: Dict[str, Any]) -> bool:
+        """添加图片，超过数量上限时拒绝添加并返回 False"""
+        if len(self.images) >= self.MAX_IMAGES:
+            return False
         if image_data:
             self.images.append(image_data)
-            self.has_images = True
+        return True
 
     def remove_image(self, index: int):
         """移除图片"""
         if 0 <= index < len(self.images):
-            self.images.pop(index)
-            self.has_images = len(self.images) > 0
+            image_data = self.images[index]
+            del self.images[index]
+            self._release_image(image_data)
 
     def clear_images(self):
         """清空所有图片"""
+        for img in self.images:
+            self._release_image(img)
         self.images.clear()
-        self.has_images = False
+
+    @staticmethod
+    def _release_image(image_data: Dict[str, Any]):
+        """释放图片已解码的像素数据"""
+        close = getattr(image_data, 'close', None)
+        if close:
+            close()
 
     def is_valid(self) -> bool:
         """检查反馈数据是否有效"""
@@ -67,24 +92,37 @@ class FeedbackData:
 
     def to_dict(self) -> Dict[str, Any]:
         """转换为字典格式"""
+        # 一次遍历同时收集图片数据和来源
+        image_data_list = []
+        image_sources = []
+        for img in self.images:
+            image_sources.append(img.get('source', '未知来源'))
+            data = img.get('data')
+            if data:
+                image_data_list.append(data)
+
         return {
             'success': True,
             'text_feedback': self.text_feedback,
-            'images': self.get_image_data_list(),
-            'image_sources': self.get_image_sources(),
+            'images': image_data_list,
+            'image_sources': image_sources,
             'has_text': self.has_text,
             'has_images': self.has_images,
-            'image_count': self.get_image_count()
+            'image_count': len(self.images)
         }
 
 
 class FeedbackCollector:
     """反馈收集器"""
 
+    __slots__ = ('timeout_seconds', 'feedback_data', '_result', '_done',
+                 'is_cancelled', 'is_submitted')
+
     def __init__(self, timeout_seconds: int = 300):
         self.timeout_seconds = timeout_seconds
         self.feedback_data = FeedbackData()
-        self.result_queue = queue.Queue()
+        self._result: Optional[Dict[str, Any]] = None
+        self._done = threading.Event()
         self.is_cancelled = False
         self.is_submitted = False
 
@@ -94,17 +132,19 @@ class FeedbackCollector:
         self.is_cancelled = False
         self.is_submitted = False
 
-        # 清空队列
-        while not self.result_queue.empty():
-            try:
-                self.result_queue.get_nowait()
-            except queue.Empty:
-                break
+        # 清空上一次的结果
+        self._result = None
+        self._done.clear()
+
+    def _set_result(self, result: Dict[str, Any]):
+        """保存结果并唤醒等待方"""
+        self._result = result
+        self._done.set()
 
-    def select_images(self) -> List[Dict[str, Any]]:
+    def select_images(self, parent=None) -> List[Dict[str, Any]]:
         """选择图片文件"""
         try:
-            images = ImageHandler.select_files_dialog()
+            images = ImageHandler.select_files_dialog(parent)
             return images
 
         except Exception as e:
@@ -133,10 +173,14 @@ class FeedbackCollector:
     def add_image(self, image_data: Dict[str, Any]) -> bool:
         """添加图片"""
         try:
-            self.feedback_data.add_image(image_data)
+            if not self.feedback_data.add_image(image_data):
+                # stdout 是 MCP 的通信通道，提示信息写入日志
+                logger.warning("添加图片失败: 图片数量过多，最多支持%d张图片",
+                               FeedbackData.MAX_IMAGES)
+                return False
             return True
         except Exception as e:
-            print(f"添加图片失败: {e}")
+            logger.error("添加图片失败: %s", e)
             return False
 
     def remove_image(self, index: int) -> bool:
@@ -172,7 +216,7 @@ class FeedbackCollector:
 
             self.is_submitted = True
             result = self.feedback_data.to_dict()
-            self.result_queue.put(result)
+            self._set_result(result)
             return result
 
         except Exception as e:
@@ -180,7 +224,7 @@ class FeedbackCollector:
                 'success': False,
                 'message': f'提交反馈失败: {str(e)}'
             }
-            self.result_queue.put(error_result)
+            self._set_result(error_result)
             return error_result
 
     def cancel_feedback(self) -> Dict[str, Any]:
@@ -191,7 +235,7 @@ class FeedbackCollector:
                 'success': False,
                 'message': get_text('operation_cancelled')
             }
-            self.result_queue.put(result)
+            self._set_result(result)
             return result
 
         except Exception as e:
@@ -199,19 +243,19 @@ class FeedbackCollector:
                 'success': False,
                 'message': f'取消操作失败: {str(e)}'
             }
-            self.result_queue.put(error_result)
+            self._set_result(error_result)
             return error_result
 
     def wait_for_result(self) -> Optional[Dict[str, Any]]:
         """等待结果"""
         try:
             # 等待结果，带超时
-            result = self.result_queue.get(timeout=self.timeout_seconds)
-            return result
+            if self._done.wait(self.timeout_seconds):
+                return self._result
 
-        except queue.Empty:
             # 超时
             return None
+
         except Exception as e:
             print(f"等待结果失败: {e}")
             return {
@@ -259,9 +303,6 @@ class FeedbackCollector:
 
             # 验证图片
             if self.feedback_data.has_images:
-                if len(self.feedback_data.images) > 10:  # 限制图片数量
-                    return False, "图片数量过多，最多支持10张图片"
-
                 for i, img in enumerate(self.feedback_data.images):
                     if not img.get('data'):
                         return False, f"第{i+1}张图片数据无效"
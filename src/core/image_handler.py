@@ -4,12 +4,16 @@
 """
 
 import io
+import os
+import logging
 import base64
+import binascii
+import struct
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-from PIL import Image, ImageGrab
+from typing import Optional, Dict, Any, List, Tuple, Iterator
+from PIL import Image, ImageGrab, UnidentifiedImageError
 import tkinter as tk
-from tkinter import filedialog, messagebox
 
 try:
     # 尝试相对导入
@@ -18,6 +22,171 @@ except ImportError:
     # 回退到绝对导入
     from utils.i18n import get_text
 
+logger = logging.getLogger(__name__)
+
+
+# PNG 文件签名及 IHDR 中宽高字段（位于偏移 16 处，两个大端 uint32）的解析器
+_PNG_SIG = b'\x89PNG\r\n\x1a\n'
+_PNG_IHDR = struct.Struct('>II')
+
+# PNG 颜色类型对应的 PIL 模式
+_PNG_MODES = {0: 'L', 2: 'RGB', 3: 'P', 4: 'LA', 6: 'RGBA'}
+
+# JPEG 段长度及 SOF 段（精度、高、宽、分量数）解析器
+_JPEG_SOI = b'\xff\xd8\xff'
+_JPEG_SEGMENT_LENGTH = struct.Struct('>H')
+_JPEG_SOF = struct.Struct('>BHHB')
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+_JPEG_MODES = {1: 'L', 3: 'RGB', 4: 'CMYK'}
+
+
+def _read_jpeg_header(f) -> Optional[Tuple[Tuple[int, int], Optional[str]]]:
+    """扫描 JPEG 段直到 SOF，返回 (尺寸, 模式)，无法解析时返回 None"""
+    f.seek(2)
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            return None
+
+        # 跳过填充字节
+        code = marker[1]
+        while code == 0xFF:
+            byte = f.read(1)
+            if not byte:
+                return None
+            code = byte[0]
+
+        # 无长度字段的独立标记
+        if code == 0x01 or 0xD0 <= code <= 0xD8:
+            continue
+
+        segment = f.read(2)
+        if len(segment) < 2:
+            return None
+        length, = _JPEG_SEGMENT_LENGTH.unpack(segment)
+
+        if code in _JPEG_SOF_MARKERS:
+            sof = f.read(_JPEG_SOF.size)
+            if len(sof) < _JPEG_SOF.size:
+                return None
+            _, height, width, components = _JPEG_SOF.unpack(sof)
+            return (width, height), _JPEG_MODES.get(components)
+
+        f.seek(length - 2, 1)
+
+
+def _sniff_image_header(path_str: str) -> Optional[Tuple[str, Tuple[int, int], Optional[str]]]:
+    """通过文件头识别 PNG/JPEG 的格式、尺寸和模式，其他格式返回 None"""
+    with open(path_str, 'rb') as f:
+        header = f.read(32)
+
+        if header.startswith(_PNG_SIG) and len(header) >= 26:
+            width, height = _PNG_IHDR.unpack_from(header, 16)
+            bit_depth, color_type = header[24], header[25]
+            mode = _PNG_MODES.get(color_type)
+            if color_type == 0 and bit_depth == 1:
+                mode = '1'
+            elif color_type == 0 and bit_depth == 16:
+                mode = 'I;16'
+            return 'PNG', (width, height), mode
+
+        if header.startswith(_JPEG_SOI):
+            result = _read_jpeg_header(f)
+            if result is not None:
+                size, mode = result
+                return 'JPEG', size, mode
+
+    return None
+
+
+# 共享的隐藏 Tk 根窗口，供没有父窗口的文件选择框和消息框使用
+_hidden_root: Optional[tk.Tk] = None
+
+
+def _get_hidden_root() -> tk.Tk:
+    """获取 Tk 根窗口：已有根窗口（如对话框窗口）时直接复用，否则创建共享的隐藏根窗口
+
+    再创建一个 tk.Tk() 会启动第二个 Tcl 解释器，在其中创建的 PhotoImage
+    等对象无法在原有窗口中使用
+    """
+    global _hidden_root
+    default_root = getattr(tk, '_default_root', None)
+    if default_root is not None:
+        return default_root
+
+    _hidden_root = tk.Tk()
+    _hidden_root.withdraw()
+    return _hidden_root
+
+
+def release_hidden_root() -> None:
+    """销毁共享的隐藏 Tk 根窗口（程序退出时调用）"""
+    global _hidden_root
+    if _hidden_root is not None:
+        try:
+            _hidden_root.destroy()
+        except tk.TclError:
+            pass
+        _hidden_root = None
+
+
+class ImageData(dict):
+    """图片数据字典
+
+    'image' 键（PIL 图片对象）在首次访问时才从 'data' 解码，
+    避免每张图片常驻一份完整的像素缓冲区
+    """
+
+    def __missing__(self, key):
+        if key == 'image' and self.get('data'):
+            img = Image.open(io.BytesIO(self['data']))
+            self['image'] = img
+            return img
+        raise KeyError(key)
+
+    def close(self):
+        """释放已解码的图片对象"""
+        img = self.pop('image', None)
+        if img is not None:
+            img.close()
+
+
+def _validate_file(path_str: str,
+                   format_hint: Optional[str] = None) -> Tuple[bytes, str, Tuple[int, int]]:
+    """读取并验证图片文件"""
+    # 使用 O_NOATIME 读取，避免更新文件访问时间（仅文件所有者可用）
+    flags = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+    try:
+        fd = os.open(path_str, flags | getattr(os, 'O_NOATIME', 0))
+    except PermissionError:
+        fd = os.open(path_str, flags)
+
+    with open(fd, 'rb', buffering=1 << 20) as f:
+        image_data = f.read()
+
+    # PNG 文件直接从 IHDR 读取尺寸，无需经过 PIL
+    if image_data.startswith(_PNG_SIG) and len(image_data) >= 24:
+        image_format = 'PNG'
+        image_size = _PNG_IHDR.unpack_from(image_data, 16)
+    else:
+        # 验证图片，优先按扩展名对应的格式解析，跳过 PIL 的格式探测
+        try:
+            img = Image.open(io.BytesIO(image_data),
+                             formats=[format_hint] if format_hint else None)
+        except UnidentifiedImageError:
+            # 扩展名与实际内容不符时回退到自动识别
+            img = Image.open(io.BytesIO(image_data))
+        image_format = img.format
+        image_size = img.size
+
+    # 检查图片尺寸
+    max_size = ImageHandler.MAX_IMAGE_SIZE
+    if image_size[0] > max_size[0] or image_size[1] > max_size[1]:
+        raise ValueError(
+            f"图片尺寸过大: {image_size}，最大支持 {max_size}")
+
+    return image_data, image_format, image_size
+
 
 class ImageHandler:
     """图片处理器"""
@@ -39,41 +208,42 @@ class ImageHandler:
     MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 
     @classmethod
-    def load_image_as_bytes(cls, file_path: str) -> bytes:
-        """从文件加载图片并返回字节数据"""
+    def _read_image_file(cls, file_path: str) -> Tuple[bytes, str, Tuple[int, int], int]:
+        """检查并读取图片文件，返回 (数据, 格式, 尺寸, 文件大小)"""
+        # 检查文件格式（在任何 I/O 之前）
+        suffix = os.path.splitext(file_path)[1].lower()
+        if suffix not in _SUPPORTED_SUFFIXES:
+            raise ValueError(get_text('invalid_image', suffix))
+
+        # 一次 stat 同时完成存在性检查和大小检查
         try:
-            path = Path(file_path)
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(get_text('file_not_found', file_path))
 
-            # 检查文件是否存在
-            if not path.exists():
-                raise FileNotFoundError(get_text('file_not_found', file_path))
+        # 检查文件大小（在读取文件之前）
+        file_size = stat.st_size
+        if file_size > cls.MAX_FILE_SIZE:
+            raise ValueError(
+                f"文件过大: {file_size / 1024 / 1024:.1f}MB，最大支持 {cls.MAX_FILE_SIZE / 1024 / 1024}MB")
 
-            # 检查文件大小
-            file_size = path.stat().st_size
-            if file_size > cls.MAX_FILE_SIZE:
-                raise ValueError(
-                    f"文件过大: {file_size / 1024 / 1024:.1f}MB，最大支持 {cls.MAX_FILE_SIZE / 1024 / 1024}MB")
-
-            # 检查文件格式
-            if path.suffix.lower() not in cls.SUPPORTED_FORMATS:
-                raise ValueError(get_text('invalid_image', path.suffix))
+        # 读取并验证图片
+        image_data, image_format, image_size = _validate_file(
+            os.fspath(file_path), cls.SUPPORTED_FORMATS[suffix])
 
-            # 读取并验证图片
-            with open(path, 'rb') as f:
-                image_data = f.read()
+        return image_data, image_format, image_size, file_size
 
-            # 验证图片
-            img = Image.open(io.BytesIO(image_data))
-
-            # 检查图片尺寸
-            if img.size[0] > cls.MAX_IMAGE_SIZE[0] or img.size[1] > cls.MAX_IMAGE_SIZE[1]:
-                raise ValueError(
-                    f"图片尺寸过大: {img.size}，最大支持 {cls.MAX_IMAGE_SIZE}")
+    @classmethod
+    def load_image_as_bytes(cls, file_path: str) -> bytes:
+        """从文件加载图片并返回字节数据"""
+        try:
+            image_data, image_format, _, _ = cls._read_image_file(file_path)
 
-            # 转换为PNG格式以确保兼容性
-            if img.format != 'PNG':
+            # 转换为PNG格式以确保兼容性（仅非PNG图片需要解码一次）
+            if image_format != 'PNG':
+                img = Image.open(io.BytesIO(image_data))
                 buffer = io.BytesIO()
-                img.save(buffer, format='PNG')
+                img.save(buffer, format='PNG', compress_level=1)
                 image_data = buffer.getvalue()
 
             return image_data
@@ -88,52 +258,26 @@ class ImageHandler:
             result = cls.load_from_clipboard()
             return result['data'] if result else None
         except Exception as e:
-            print(f"从剪贴板获取图片失败: {e}")
+            logger.warning("从剪贴板获取图片失败: %s", e)
             return None
 
     @classmethod
     def load_from_file(cls, file_path: str) -> Optional[Dict[str, Any]]:
         """从文件加载图片"""
         try:
-            path = Path(file_path)
-
-            # 检查文件是否存在
-            if not path.exists():
-                raise FileNotFoundError(get_text('file_not_found', file_path))
-
-            # 检查文件大小
-            file_size = path.stat().st_size
-            if file_size > cls.MAX_FILE_SIZE:
-                raise ValueError(
-                    f"文件过大: {file_size / 1024 / 1024:.1f}MB，最大支持 {cls.MAX_FILE_SIZE / 1024 / 1024}MB")
-
-            # 检查文件格式
-            if path.suffix.lower() not in cls.SUPPORTED_FORMATS:
-                raise ValueError(get_text('invalid_image', path.suffix))
-
-            # 读取文件数据
-            with open(path, 'rb') as f:
-                image_data = f.read()
-
-            # 验证图片
-            img = Image.open(io.BytesIO(image_data))
-
-            # 检查图片尺寸
-            if img.size[0] > cls.MAX_IMAGE_SIZE[0] or img.size[1] > cls.MAX_IMAGE_SIZE[1]:
-                raise ValueError(
-                    f"图片尺寸过大: {img.size}，最大支持 {cls.MAX_IMAGE_SIZE}")
-
-            return {
-                'data': image_data,
-                'image': img,
-                'source': f'文件: {path.name}',
-                'size': img.size,
-                'format': img.format,
-                'file_size': file_size
-            }
+            image_data, image_format, image_size, file_size = cls._read_image_file(
+                file_path)
+
+            return ImageData(
+                data=image_data,
+                source=f'文件: {Path(file_path).name}',
+                size=image_size,
+                format=image_format,
+                file_size=file_size
+            )
 
         except Exception as e:
-            print(f"加载图片文件失败: {e}")
+            logger.warning("加载图片文件失败: %s", e)
             return None
 
     @classmethod
@@ -146,6 +290,13 @@ class ImageHandler:
             if img is None:
                 return None
 
+            # 部分平台复制文件时返回的是文件路径列表
+            if isinstance(img, list):
+                for file_path in img:
+                    if Path(file_path).suffix.lower() in _SUPPORTED_SUFFIXES:
+                        return cls.load_from_file(file_path)
+                return None
+
             # 检查图片尺寸
             if img.size[0] > cls.MAX_IMAGE_SIZE[0] or img.size[1] > cls.MAX_IMAGE_SIZE[1]:
                 raise ValueError(
@@ -153,65 +304,101 @@ class ImageHandler:
 
             # 转换为PNG格式
             buffer = io.BytesIO()
-            img.save(buffer, format='PNG')
+            img.save(buffer, format='PNG', compress_level=1)
             image_data = buffer.getvalue()
 
-            return {
-                'data': image_data,
-                'image': img,
-                'source': '剪贴板',
-                'size': img.size,
-                'format': 'PNG',
-                'file_size': len(image_data)
-            }
+            return ImageData(
+                data=image_data,
+                image=img,
+                source='剪贴板',
+                size=img.size,
+                format='PNG',
+                file_size=len(image_data)
+            )
 
         except ImportError:
-            print("ImageGrab功能在当前系统上不可用")
+            logger.warning("ImageGrab功能在当前系统上不可用")
             return None
         except Exception as e:
-            print(f"从剪贴板获取图片失败: {e}")
+            logger.warning("从剪贴板获取图片失败: %s", e)
             return None
 
     @classmethod
     def select_files_dialog(cls, parent: tk.Widget = None) -> List[Dict[str, Any]]:
         """显示文件选择对话框"""
         try:
-            file_types = [
-                ("图片文件", "*.png *.jpg *.jpeg *.gif *.bmp *.webp"),
-                ("PNG文件", "*.png"),
-                ("JPEG文件", "*.jpg *.jpeg"),
-                ("所有文件", "*.*")
-            ]
-
-            file_paths = filedialog.askopenfilenames(
-                parent=parent,
-                title="选择图片文件（可多选）",
-                filetypes=file_types
-            )
+            # 未指定父窗口时复用共享的隐藏根窗口，避免重复初始化 Tk
+            if parent is None:
+                parent = _get_hidden_root()
 
-            images = []
-            failed_files = []
-
-            for file_path in file_paths:
-                image_data = cls.load_from_file(file_path)
-                if image_data:
-                    images.append(image_data)
-                else:
-                    failed_files.append(Path(file_path).name)
+            file_paths = cls.ask_image_files(parent)
+            images, failed_files = cls.load_files(file_paths)
 
             # 显示失败的文件
-            if failed_files:
-                messagebox.showwarning(
-                    "警告",
-                    f"以下文件加载失败:\n" + "\n".join(failed_files)
-                )
+            cls.warn_failed_files(failed_files, parent)
 
             return images
 
         except Exception as e:
-            print(f"文件选择对话框失败: {e}")
+            logger.exception("文件选择对话框失败: %s", e)
             return []
 
+    @classmethod
+    def ask_image_files(cls, parent: tk.Widget = None) -> Tuple[str, ...]:
+        """显示文件选择对话框并返回选中的路径（须在 Tk 主线程调用）"""
+        if parent is None:
+            parent = _get_hidden_root()
+
+        file_types = [
+            ("图片文件", "*.png *.jpg *.jpeg *.gif *.bmp *.webp"),
+            ("PNG文件", "*.png"),
+            ("JPEG文件", "*.jpg *.jpeg"),
+            ("所有文件", "*.*")
+        ]
+
+        from tkinter import filedialog
+        file_paths = filedialog.askopenfilenames(
+            parent=parent,
+            title="选择图片文件（可多选）",
+            filetypes=file_types
+        )
+        # 取消选择时部分平台返回空字符串
+        return tuple(file_paths) if file_paths else ()
+
+    @classmethod
+    def load_files(cls, file_paths: Tuple[str, ...]) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """并行加载多个图片文件（不涉及 Tk，可在后台线程调用）
+
+        Returns:
+            (成功加载的图片数据列表, 加载失败的文件名列表)
+        """
+        images = []
+        failed_files = []
+
+        if file_paths:
+            # 文件读取与解码会释放 GIL，多个文件并行加载
+            with ThreadPoolExecutor(max_workers=min(8, len(file_paths))) as executor:
+                results = list(executor.map(cls.load_from_file, file_paths))
+
+            for file_path, image_data in zip(file_paths, results):
+                if image_data:
+                    images.append(image_data)
+                else:
+                    failed_files.append(Path(file_path).name)
+
+        return images, failed_files
+
+    @classmethod
+    def warn_failed_files(cls, failed_files: List[str], parent: tk.Widget = None):
+        """提示加载失败的文件（须在 Tk 主线程调用）"""
+        if failed_files:
+            from tkinter import messagebox
+            messagebox.showwarning(
+                "警告",
+                f"以下文件加载失败:\n" + "\n".join(failed_files),
+                parent=parent
+            )
+
     @classmethod
     def validate_image_data(cls, image_data: bytes) -> bool:
         """验证图片数据"""
@@ -237,18 +424,27 @@ class ImageHandler:
         try:
             path = Path(image_path)
 
-            if not path.exists():
+            try:
+                file_size = os.stat(image_path).st_size
+            except FileNotFoundError:
                 return {'error': f'文件不存在: {image_path}'}
 
-            with Image.open(path) as img:
-                info = {
-                    'filename': path.name,
-                    'format': img.format,
-                    'size': img.size,
-                    'mode': img.mode,
-                    'file_size': path.stat().st_size,
-                    'file_size_mb': round(path.stat().st_size / 1024 / 1024, 2)
-                }
+            # PNG/JPEG 直接解析文件头，其他格式交给 PIL
+            header = _sniff_image_header(os.fspath(image_path))
+            if header is not None:
+                image_format, image_size, mode = header
+            else:
+                with Image.open(path) as img:
+                    image_format, image_size, mode = img.format, img.size, img.mode
+
+            info = {
+                'filename': path.name,
+                'format': image_format,
+                'size': image_size,
+                'mode': mode,
+                'file_size': file_size,
+                'file_size_mb': round(file_size / 1024 / 1024, 2)
+            }
 
             return info
 
@@ -275,23 +471,38 @@ class ImageHandler:
             thumbnail.thumbnail(size, Image.Resampling.LANCZOS)
             return thumbnail
         except Exception as e:
-            print(f"创建缩略图失败: {e}")
+            logger.warning("创建缩略图失败: %s", e)
             return image
 
     @classmethod
     def convert_to_base64(cls, image_data: bytes) -> str:
         """将图片数据转换为base64字符串"""
         try:
-            return base64.b64encode(image_data).decode('utf-8')
+            return binascii.b2a_base64(image_data, newline=False).decode('ascii')
         except Exception as e:
-            print(f"转换base64失败: {e}")
+            logger.warning("转换base64失败: %s", e)
             return ""
 
+    @classmethod
+    def convert_to_base64_chunked(cls, image_data: bytes,
+                                  chunk_size: int = 3 * 1024 * 1024) -> Iterator[str]:
+        """分块将图片数据转换为base64字符串，适合边编码边输出的大图片"""
+        # 块大小需为3的倍数，保证各块编码结果可以直接拼接
+        chunk_size = max(3, chunk_size - chunk_size % 3)
+        view = memoryview(image_data)
+        for start in range(0, len(view), chunk_size):
+            yield binascii.b2a_base64(view[start:start + chunk_size],
+                                      newline=False).decode('ascii')
+
     @classmethod
     def convert_from_base64(cls, base64_str: str) -> Optional[bytes]:
         """从base64字符串转换为图片数据"""
         try:
             return base64.b64decode(base64_str)
         except Exception as e:
-            print(f"从base64转换失败: {e}")
+            logger.warning("从base64转换失败: %s", e)
             return None
+
+
+# 支持的扩展名集合（模块级预计算，用于快速判断）
+_SUPPORTED_SUFFIXES = frozenset(ImageHandler.SUPPORTED_FORMATS)
@@ -8,6 +8,7 @@ from mcp.server.fastmcp import FastMCP
 import os
 import sys
 import atexit
+import logging
 from typing import List
 
 # 设置Python IO编码为UTF-8，确保中文字符正确处理
@@ -28,13 +29,13 @@ else:
 try:
     # 尝试相对导入（当作为包的一部分时）
     from .ui.feedback_dialog import ModernFeedbackDialog, SimpleImagePickerDialog
-    from .core.image_handler import ImageHandler
+    from .core.image_handler import ImageHandler, release_hidden_root
     from .utils.gui_utils import validate_gui_environment
     from .utils.i18n import get_text
 except ImportError:
     # 回退到绝对导入（当作为模块运行时）
     from ui.feedback_dialog import ModernFeedbackDialog, SimpleImagePickerDialog
-    from core.image_handler import ImageHandler
+    from core.image_handler import ImageHandler, release_hidden_root
     from utils.gui_utils import validate_gui_environment
     from utils.i18n import get_text
 
@@ -49,6 +50,11 @@ mcp = FastMCP(
 DEFAULT_DIALOG_TIMEOUT = 600  # 10分钟
 DIALOG_TIMEOUT = int(os.getenv("MCP_DIALOG_TIMEOUT", DEFAULT_DIALOG_TIMEOUT))
 
+# 日志级别，设置为 DEBUG 时输出调试信息
+LOG_LEVEL = os.getenv("MCP_LOG_LEVEL", "INFO").upper()
+
+logger = logging.getLogger(__name__)
+
 # 全局对话框实例（重用窗口）
 _feedback_dialog = None
 _image_picker_dialog = None
@@ -79,14 +85,19 @@ def _cleanup_dialogs():
             _feedback_dialog.destroy()
             _feedback_dialog = None
     except Exception as e:
-        print(f"[ERROR] 清理反馈对话框失败: {e}", file=sys.stderr)
+        logger.error("清理反馈对话框失败: %s", e)
 
     try:
         if _image_picker_dialog:
             # SimpleImagePickerDialog 不需要特殊清理
             _image_picker_dialog = None
     except Exception as e:
-        print(f"[ERROR] 清理图片选择对话框失败: {e}", file=sys.stderr)
+        logger.error("清理图片选择对话框失败: %s", e)
+
+    try:
+        release_hidden_root()
+    except Exception as e:
+        logger.error("清理隐藏根窗口失败: %s", e)
 
 
 # 注册程序退出时的清理函数
@@ -103,17 +114,17 @@ def collect_feedback() -> List:
         包含用户反馈内容的列表，可能包含文本和图片
     """
     try:
-        print(
-            f"[DEBUG] {get_text('debug_collecting_feedback', DIALOG_TIMEOUT)}", file=sys.stderr)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(get_text('debug_collecting_feedback', DIALOG_TIMEOUT))
 
         # 验证GUI环境
         is_valid, message = validate_gui_environment()
         if not is_valid:
-            print(
-                f"[ERROR] {get_text('env_validation_failed', message)}", file=sys.stderr)
+            logger.error(get_text('env_validation_failed', message))
             raise Exception(message)
 
-        print(f"[DEBUG] {get_text('debug_gui_validated')}", file=sys.stderr)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(get_text('debug_gui_validated'))
 
         # 获取对话框实例（重用窗口）
         dialog = _get_feedback_dialog()
@@ -125,17 +136,17 @@ def collect_feedback() -> List:
         result = dialog.show_dialog()
 
         if result is None:
-            print(
-                f"[ERROR] {get_text('timeout_error', DIALOG_TIMEOUT)}", file=sys.stderr)
+            logger.error(get_text('timeout_error', DIALOG_TIMEOUT))
             raise Exception(get_text('timeout_error', DIALOG_TIMEOUT))
 
         if not result['success']:
-            print(
-                f"[ERROR] {get_text('feedback_submit_failed', result.get('message', '未知错误'))}", file=sys.stderr)
+            logger.error(get_text('feedback_submit_failed',
+                                  result.get('message', '未知错误')))
             raise Exception(result.get(
                 'message', get_text('feedback_cancelled')))
 
-        print(f"[DEBUG] {get_text('debug_feedback_success')}", file=sys.stderr)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(get_text('debug_feedback_success'))
 
         # 构建返回内容列表
         feedback_items = []
@@ -154,20 +165,26 @@ def collect_feedback() -> List:
                     feedback_items.append(
                         MCPImage(data=image_data, format='png'))
 
-        print(
-            f"[DEBUG] {get_text('debug_feedback_items', len(feedback_items))}", file=sys.stderr)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(get_text('debug_feedback_items', len(feedback_items)))
         return feedback_items
 
     except Exception as e:
         # 确保异常不会导致MCP服务器崩溃
         error_msg = str(e)
-        print(
-            f"[ERROR] {get_text('collect_feedback_error', error_msg)}", file=sys.stderr)
+        logger.error(get_text('collect_feedback_error', error_msg))
         raise Exception(get_text('feedback_collection_failed', error_msg))
 
 
 def main():
     """主入口函数"""
+    # 配置日志输出到 stderr（stdout 用于 MCP 协议通信）
+    logging.basicConfig(
+        level=getattr(logging, LOG_LEVEL, logging.INFO),
+        format='[%(levelname)s] %(message)s',
+        stream=sys.stderr
+    )
+
     try:
         print(get_text('server_starting'), file=sys.stderr)
 
@@ -3,21 +3,74 @@ macOS风格UI组件
 提供深色主题界面组件
 """
 
+import hashlib
+import weakref
 import tkinter as tk
-from PIL import Image, ImageTk
-from typing import List, Callable, Optional, Any
+from PIL import Image, ImageOps, ImageTk
+from typing import List, Callable, Optional, Any, Union
 from io import BytesIO
+from concurrent.futures import Future, ThreadPoolExecutor
 
 try:
     # 尝试相对导入
     from .theme import DarkThemeManager
     from ..core.image_handler import ImageHandler
     from ..utils.i18n import get_text
+    from ..utils.gui_utils import screen_size
 except ImportError:
     # 回退到绝对导入
     from ui.theme import DarkThemeManager
     from core.image_handler import ImageHandler
     from utils.i18n import get_text
+    from utils.gui_utils import screen_size
+
+
+# 缩略图后台生成线程池及主线程轮询间隔（毫秒）
+_THUMBNAIL_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+_THUMBNAIL_POLL_MS = 15
+
+# 预览缩略图最大尺寸
+_THUMBNAIL_SIZE = (120, 100)
+
+# 按图片数据摘要共享的缩略图 PhotoImage，不再被任何图片引用时自动释放
+_PHOTO_CACHE: 'weakref.WeakValueDictionary[bytes, ImageTk.PhotoImage]' = \
+    weakref.WeakValueDictionary()
+
+# 按钮样式配置（由主题颜色计算一次，所有按钮共享）
+_BUTTON_STYLES = {
+    'primary': {
+        'bg': DarkThemeManager.get_color('accent'),
+        'fg': '#ffffff',
+        'activebackground': DarkThemeManager.get_color('active'),
+        'activeforeground': '#ffffff',
+        'highlightbackground': DarkThemeManager.get_color('accent'),
+        'disabledforeground': '#888888',
+    },
+    'secondary': {
+        'bg': DarkThemeManager.get_color('bg_tertiary'),
+        'fg': DarkThemeManager.get_color('text_primary'),
+        'activebackground': DarkThemeManager.get_color('border'),
+        'activeforeground': DarkThemeManager.get_color('text_primary'),
+        'highlightbackground': DarkThemeManager.get_color('bg_tertiary'),
+        'disabledforeground': '#888888',
+    },
+    'success': {
+        'bg': DarkThemeManager.get_color('success'),
+        'fg': '#ffffff',
+        'activebackground': '#3da58a',
+        'activeforeground': '#ffffff',
+        'highlightbackground': DarkThemeManager.get_color('success'),
+        'disabledforeground': '#888888',
+    },
+    'danger': {
+        'bg': DarkThemeManager.get_color('error'),
+        'fg': '#ffffff',
+        'activebackground': '#d73a49',
+        'activeforeground': '#ffffff',
+        'highlightbackground': DarkThemeManager.get_color('error'),
+        'disabledforeground': '#888888',
+    }
+}
 
 
 class MacOSCard(tk.Frame):
@@ -52,6 +105,12 @@ class MacOSCard(tk.Frame):
 class MacOSButton(tk.Button):
     """macOS风格按钮组件"""
 
+    # 样式 -> (常态背景色, 悬停背景色)，导入时由样式表解析一次
+    _HOVER_MAP = {
+        style: (config['bg'], config['activebackground'])
+        for style, config in _BUTTON_STYLES.items()
+    }
+
     def __init__(self, parent: tk.Widget, text: str, style: str = 'primary',
                  icon: str = "", **kwargs):
         self.theme = DarkThemeManager
@@ -59,7 +118,8 @@ class MacOSButton(tk.Button):
         # 处理图标
         display_text = f"{icon} {text}" if icon else text
 
-        # 先初始化基本属性
+        # 样式配置与基本属性一次性传入构造，强制覆盖系统默认
+        config = _BUTTON_STYLES.get(style, _BUTTON_STYLES['primary'])
         super().__init__(
             parent,
             text=display_text,
@@ -68,119 +128,71 @@ class MacOSButton(tk.Button):
             bd=0,
             cursor='hand2',
             highlightthickness=0,
-            **kwargs
+            **{**kwargs, **config}
         )
 
-        # 应用样式
-        self._apply_style(style)
+        # 记录常态与悬停背景色，悬停时无需再读取控件或主题
+        self._original_bg, self._hover_bg = self._HOVER_MAP.get(
+            style, self._HOVER_MAP['primary'])
 
         # 设置悬停效果
         self._setup_hover_effects()
 
-    def _apply_style(self, style: str):
-        """应用按钮样式"""
-        styles = {
-            'primary': {
-                'bg': self.theme.get_color('accent'),
-                'fg': '#ffffff',
-                'activebackground': self.theme.get_color('active'),
-                'activeforeground': '#ffffff',
-                'highlightbackground': self.theme.get_color('accent'),
-                'disabledforeground': '#888888',
-            },
-            'secondary': {
-                'bg': self.theme.get_color('bg_tertiary'),
-                'fg': self.theme.get_color('text_primary'),
-                'activebackground': self.theme.get_color('border'),
-                'activeforeground': self.theme.get_color('text_primary'),
-                'highlightbackground': self.theme.get_color('bg_tertiary'),
-                'disabledforeground': '#888888',
-            },
-            'success': {
-                'bg': self.theme.get_color('success'),
-                'fg': '#ffffff',
-                'activebackground': '#3da58a',
-                'activeforeground': '#ffffff',
-                'highlightbackground': self.theme.get_color('success'),
-                'disabledforeground': '#888888',
-            },
-            'danger': {
-                'bg': self.theme.get_color('error'),
-                'fg': '#ffffff',
-                'activebackground': '#d73a49',
-                'activeforeground': '#ffffff',
-                'highlightbackground': self.theme.get_color('error'),
-                'disabledforeground': '#888888',
-            }
-        }
-
-        config = styles.get(style, styles['primary'])
-
-        # 强制设置样式，覆盖系统默认
-        self.configure(**config)
-
     def _setup_hover_effects(self):
         """设置悬停效果"""
-        original_bg = self['bg']
-
-        # 根据按钮样式设置不同的悬停颜色
-        if original_bg == self.theme.get_color('accent'):  # primary按钮
-            hover_bg = self.theme.get_color('active')
-        elif original_bg == self.theme.get_color('success'):  # success按钮
-            hover_bg = '#3da58a'
-        elif original_bg == self.theme.get_color('error'):  # danger按钮
-            hover_bg = '#d73a49'
-        else:  # secondary按钮
-            hover_bg = self.theme.get_color('border')
-
-        def on_enter(event):
-            self.configure(bg=hover_bg)
-
-        def on_leave(event):
-            self.configure(bg=original_bg)
-
-        self.bind('<Enter>', on_enter)
-        self.bind('<Leave>', on_leave)
+        self.bind('<Enter>', lambda e: self.configure(bg=self._hover_bg))
+        self.bind('<Leave>', lambda e: self.configure(bg=self._original_bg))
 
 
 class MacOSTextArea(tk.Frame):
     """macOS风格文本输入区域"""
 
     def __init__(self, parent: tk.Widget, placeholder: str = "", height: int = 6, **kwargs):
-        super().__init__(parent, **kwargs)
-
         self.theme = DarkThemeManager
         self.placeholder = placeholder
-        self.has_placeholder = True
+        self.on_modified = None
 
-        self.configure(
-            bg=self.theme.get_color('bg_secondary'),
-            highlightthickness=0,
-            bd=0
-        )
+        color = self.theme.get_color
+        bg_secondary = color('bg_secondary')
+        accent = color('accent')
+
+        # 外观配置随构造一并传入，避免构造后再逐项 configure
+        super().__init__(parent, **{
+            **kwargs,
+            'bg': bg_secondary,
+            'highlightthickness': 0,
+            'bd': 0,
+        })
 
         # 创建文本框 - 使用更彻底的方法移除高亮
         self.text_widget = tk.Text(
             self,
             height=height,
-            bg=self.theme.get_color('bg_secondary'),
-            fg=self.theme.get_color('text_primary'),
-            insertbackground=self.theme.get_color('accent'),
-            selectbackground=self.theme.get_color('accent'),
+            bg=bg_secondary,
+            fg=color('text_primary'),
+            insertbackground=accent,
+            selectbackground=accent,
             selectforeground='#ffffff',
             font=self.theme.get_font('body'),
             wrap=tk.WORD,
             relief=tk.FLAT,
             bd=0,
             highlightthickness=0,
-            highlightcolor=self.theme.get_color('bg_secondary'),
-            highlightbackground=self.theme.get_color('bg_secondary'),
+            highlightcolor=bg_secondary,
+            highlightbackground=bg_secondary,
             borderwidth=0
         )
         self.text_widget.pack(fill=tk.BOTH, expand=True)
 
-        # 设置占位符
+        # 文本内容缓存，仅在内容被修改后才重新从 Tk 读取
+        self._cached_text = ""
+        self._is_dirty = False
+        self.text_widget.bind('<<Modified>>', self._on_modified)
+
+        # 设置占位符（以标签着色，无需切换文本框前景色）
         if placeholder:
+            self.text_widget.tag_configure(
+                'placeholder', foreground=color('text_secondary'))
             self._set_placeholder()
             self.text_widget.bind('<FocusIn>', self._on_focus_in)
             self.text_widget.bind('<FocusOut>', self._on_focus_out)
@@ -188,46 +200,93 @@ class MacOSTextArea(tk.Frame):
     def _set_placeholder(self):
         """设置占位符文本"""
         self.text_widget.delete(1.0, tk.END)
-        self.text_widget.insert(1.0, self.placeholder)
-        self.text_widget.configure(fg=self.theme.get_color('text_secondary'))
-        self.has_placeholder = True
+        self.text_widget.insert(1.0, self.placeholder, 'placeholder')
+        self._mark_programmatic_change()
 
     def _on_focus_in(self, event):
         """获得焦点时清除占位符"""
-        if self.has_placeholder:
+        if self.text_widget.tag_ranges('placeholder'):
             self.text_widget.delete(1.0, tk.END)
-            self.text_widget.configure(fg=self.theme.get_color('text_primary'))
-            self.has_placeholder = False
+            self._mark_programmatic_change()
 
     def _on_focus_out(self, event):
         """失去焦点时恢复占位符"""
-        if not self.text_widget.get(1.0, tk.END).strip():
+        if not self.get_text():
             self._set_placeholder()
 
+    def _on_modified(self, event):
+        """文本内容变化时标记缓存失效"""
+        # 重置修改标志同样会触发该事件，只在标志为真时才标记；
+        # 事件为异步派发，程序修改内容的位置会自行标记
+        if self.text_widget.edit_modified():
+            self._is_dirty = True
+            if self.on_modified:
+                self.on_modified()
+
     def get_text(self) -> str:
-        """获取文本内容"""
-        if self.has_placeholder:
-            return ""
-        return self.text_widget.get(1.0, tk.END).strip()
+        """获取文本内容（显示占位符时返回空字符串）"""
+        if self._is_dirty:
+            if self.text_widget.tag_ranges('placeholder'):
+                self._cached_text = ""
+            else:
+                self._cached_text = self.text_widget.get(1.0, tk.END).strip()
+            self._is_dirty = False
+            # 重置修改标志，下次编辑时重新触发 <<Modified>>
+            self.text_widget.edit_modified(False)
+        return self._cached_text
 
     def set_text(self, text: str):
         """设置文本内容"""
         self.text_widget.delete(1.0, tk.END)
         self.text_widget.insert(1.0, text)
-        self.text_widget.configure(fg=self.theme.get_color('text_primary'))
-        self.has_placeholder = False
+        self._mark_programmatic_change()
+
+    def _mark_programmatic_change(self):
+        """程序修改内容后标记缓存失效并重置修改标志
+
+        <<Modified>> 事件异步派发，且只在修改标志由假变真时触发；重置标志后
+        排队中的事件会被忽略，用户之后的输入也能重新触发 on_modified
+        """
+        self._is_dirty = True
+        self.text_widget.edit_modified(False)
+
+
+def _photo_cache_key(image_data: 'ImageEntry') -> bytes:
+    """计算缩略图缓存键（图片数据的摘要，在后台线程中执行）"""
+    return hashlib.blake2b(image_data.data, digest_size=16).digest()
+
+
+class ImageEntry:
+    """画廊中的单张图片"""
+
+    __slots__ = ('image', 'data', 'thumb_photo')
+
+    def __init__(self, image: Optional[Image.Image] = None,
+                 data: Optional[bytes] = None,
+                 thumb_photo: Optional[ImageTk.PhotoImage] = None):
+        self.image = image
+        self.data = data
+        self.thumb_photo = thumb_photo
+
+    @classmethod
+    def from_dict(cls, image_data: dict) -> 'ImageEntry':
+        """从图片数据字典创建（不会触发 'image' 的延迟解码）"""
+        return cls(image_data.get('image'), image_data.get('data'),
+                   image_data.get('thumb_photo'))
 
 
 class ImagePreviewCard(tk.Frame):
     """图片预览卡片组件"""
 
-    def __init__(self, parent: tk.Widget, image_data: dict,
+    def __init__(self, parent: tk.Widget, image_data: 'ImageEntry',
                  on_remove: Optional[Callable] = None, **kwargs):
         super().__init__(parent, **kwargs)
 
         self.theme = DarkThemeManager
         self.image_data = image_data
         self.on_remove = on_remove
+        self.photo = None
+        self._error_label = None
 
         self.configure(
             bg=self.theme.get_color('bg_secondary'),
@@ -249,36 +308,21 @@ class ImagePreviewCard(tk.Frame):
     def _create_preview(self):
         """创建图片预览"""
         try:
-            # 获取图片对象
-            img = None
-            if 'image' in self.image_data and self.image_data['image'] is not None:
-                # 直接使用PIL图片对象
-                img = self.image_data['image']
-            elif 'data' in self.image_data and self.image_data['data'] is not None:
-                # 从字节数据创建图片对象
-                img = Image.open(BytesIO(self.image_data['data']))
-            else:
-                raise ValueError("图片数据格式不正确")
-
-            # 创建缩略图
-            img_copy = img.copy()
-            img_copy.thumbnail((120, 100), Image.Resampling.LANCZOS)
-
-            # 转换为tkinter格式
-            self.photo = ImageTk.PhotoImage(img_copy)
+            bg_secondary = self.theme.get_color('bg_secondary')
 
             # 创建图片容器（用于放置悬浮按钮）
             self.image_container = tk.Frame(
                 self.main_container,
-                bg=self.theme.get_color('bg_secondary')
+                bg=bg_secondary
             )
             self.image_container.pack()
 
-            # 图片标签
+            # 图片标签（缩略图生成前先显示占位文字）
             self.img_label = tk.Label(
                 self.image_container,
-                image=self.photo,
-                bg=self.theme.get_color('bg_secondary'),
+                text="...",
+                bg=bg_secondary,
+                fg=self.theme.get_color('text_secondary'),
                 cursor='hand2'
             )
             self.img_label.pack()
@@ -306,58 +350,204 @@ class ImagePreviewCard(tk.Frame):
             # 绑定鼠标悬浮事件
             self._bind_hover_events()
 
+            self._load_thumbnail()
+
         except Exception as e:
-            # 错误显示
-            error_label = self.theme.create_styled_label(
-                self.main_container, f"{get_text('image_preview_failed')}\n{str(e)}", style='small'
-            )
-            error_label.configure(
-                bg=self.theme.get_color('bg_secondary'),
-                fg=self.theme.get_color('error'),
-                justify=tk.CENTER
-            )
-            error_label.pack(padx=8, pady=8)
-            print(f"图片预览失败: {e}")  # 添加调试信息
+            self._show_error(e)
+
+    def set_image_data(self, image_data: 'ImageEntry'):
+        """重新绑定图片数据（画廊复用卡片时调用）"""
+        self.image_data = image_data
+
+        if self._error_label is not None:
+            # 上次预览失败时图片容器已销毁，需要重新创建
+            self._error_label.destroy()
+            self._error_label = None
+            self._create_preview()
+            return
+
+        try:
+            self._load_thumbnail()
+        except Exception as e:
+            self._show_error(e)
+
+    def release_image(self):
+        """释放图片数据和缩略图引用（卡片回收到复用池时调用）"""
+        self.image_data = None
+        self.photo = None
+
+        if self._error_label is None:
+            self.img_label.configure(image='', text="...")
+            if hasattr(self, 'delete_btn'):
+                self.delete_btn.place_forget()
+
+    def _load_thumbnail(self):
+        """显示当前图片数据的缩略图"""
+        image_data = self.image_data
+
+        # 缩略图缓存在图片数据上，卡片重建时无需重新解码和缩放
+        photo = image_data.thumb_photo
+        if photo is not None:
+            self._install_photo(photo)
+        elif image_data.data is not None:
+            # 先在后台计算数据摘要，内容相同的图片共享同一个 PhotoImage
+            self._run_in_background(_photo_cache_key, image_data,
+                                    self._on_cache_key)
+        else:
+            self._run_in_background(self._create_thumbnail, image_data,
+                                    self._on_thumbnail, None)
+
+    def _on_cache_key(self, image_data: 'ImageEntry', key: bytes):
+        """数据摘要计算完成：命中缓存直接显示，否则在后台生成缩略图"""
+        photo = _PHOTO_CACHE.get(key)
+        if photo is not None:
+            image_data.thumb_photo = photo
+            self._install_photo(photo)
+        else:
+            self._run_in_background(self._create_thumbnail, image_data,
+                                    self._on_thumbnail, key)
+
+    def _on_thumbnail(self, image_data: 'ImageEntry', thumbnail: Image.Image,
+                      key: Optional[bytes]):
+        """缩略图生成完成后显示图片"""
+        # 转换为tkinter格式（PhotoImage 只能在主线程创建）
+        photo = ImageTk.PhotoImage(thumbnail)
+        if key is not None:
+            _PHOTO_CACHE[key] = photo
+        image_data.thumb_photo = photo
+        self._install_photo(photo)
+
+    def _run_in_background(self, func: Callable, image_data: 'ImageEntry',
+                           callback: Callable, *args):
+        """在后台线程执行任务，完成后在主线程以结果调用回调"""
+        future = _THUMBNAIL_EXECUTOR.submit(func, image_data)
+        self.after(_THUMBNAIL_POLL_MS, self._poll_future,
+                   future, image_data, callback, args)
+
+    def _poll_future(self, future: Future, image_data: 'ImageEntry',
+                     callback: Callable, args: tuple):
+        """在主线程中检查后台任务是否完成"""
+        # 卡片已销毁或已被复用于其他图片时丢弃结果
+        if not self.winfo_exists() or self.image_data is not image_data:
+            return
+
+        if not future.done():
+            self.after(_THUMBNAIL_POLL_MS, self._poll_future,
+                       future, image_data, callback, args)
+            return
+
+        try:
+            callback(image_data, future.result(), *args)
+        except Exception as e:
+            self._show_error(e)
+
+    def _install_photo(self, photo: ImageTk.PhotoImage):
+        """将缩略图显示到图片标签上"""
+        self.photo = photo
+        self.img_label.configure(image=photo, text="")
+
+    def _show_error(self, error: Exception):
+        """显示预览失败信息"""
+        if hasattr(self, 'image_container'):
+            self.image_container.destroy()
+            del self.image_container
+
+        # 错误显示
+        self._error_label = error_label = self.theme.create_styled_label(
+            self.main_container, f"{get_text('image_preview_failed')}\n{str(error)}", style='small'
+        )
+        error_label.configure(
+            bg=self.theme.get_color('bg_secondary'),
+            fg=self.theme.get_color('error'),
+            justify=tk.CENTER
+        )
+        error_label.pack(padx=8, pady=8)
+        print(f"图片预览失败: {error}")  # 添加调试信息
+
+    @staticmethod
+    def _create_thumbnail(image_data: 'ImageEntry') -> Image.Image:
+        """创建缩略图（在后台线程中执行）"""
+        shared_img = image_data.image
+        if shared_img is not None:
+            if shared_img.width <= _THUMBNAIL_SIZE[0] and shared_img.height <= _THUMBNAIL_SIZE[1]:
+                # 小图与 thumbnail 一致不放大，复制代价很小
+                return shared_img.copy()
+
+            # 共享的PIL图片对象不能原地缩放，先整数倍缩小得到新图片，避免整图复制
+            img = ImagePreviewCard._reduce_for_thumbnail(shared_img)
+            if img is shared_img:
+                return ImageOps.contain(shared_img, _THUMBNAIL_SIZE,
+                                        Image.Resampling.LANCZOS)
+            img.thumbnail(_THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
+            return img
+
+        if image_data.data is None:
+            raise ValueError("图片数据格式不正确")
+
+        # 从字节数据创建新的图片对象并直接缩放，JPEG 可按目标尺寸缩小解码
+        img = Image.open(BytesIO(image_data.data))
+        if img.draft('RGB', (_THUMBNAIL_SIZE[0] * 2, _THUMBNAIL_SIZE[1] * 2)):
+            resample = Image.Resampling.BILINEAR
+        else:
+            img = ImagePreviewCard._reduce_for_thumbnail(img)
+            resample = Image.Resampling.LANCZOS
+
+        img.thumbnail(_THUMBNAIL_SIZE, resample)
+        return img
+
+    @staticmethod
+    def _reduce_for_thumbnail(img: Image.Image) -> Image.Image:
+        """按整数倍快速缩小到不小于缩略图两倍的尺寸，之后的 LANCZOS 只需处理小图"""
+        factor = min(img.width // (_THUMBNAIL_SIZE[0] * 2),
+                     img.height // (_THUMBNAIL_SIZE[1] * 2))
+        if factor > 1:
+            try:
+                return img.reduce(factor)
+            except ValueError:
+                # 调色板等模式不支持 reduce，交由 LANCZOS 直接处理
+                pass
+        return img
 
     def _bind_hover_events(self):
         """绑定鼠标悬浮事件"""
         if not hasattr(self, 'delete_btn'):
             return
 
-        def on_enter(event):
-            # 计算删除按钮的居中位置
-            img_width = self.img_label.winfo_width()
-            img_height = self.img_label.winfo_height()
+        # 图片容器尺寸，仅在几何变化时更新，悬浮处理中无需查询 Tk
+        self._container_size = (0, 0)
 
-            if img_width > 1 and img_height > 1:  # 确保组件已经渲染
-                btn_x = (img_width - 30) // 2  # 按钮宽度约30
-                btn_y = (img_height - 20) // 2  # 按钮高度约20
+        def on_configure(event):
+            self._container_size = (event.width, event.height)
 
-                self.delete_btn.place(x=btn_x, y=btn_y)
+        def on_enter(event):
+            # 由 Tk 负责居中放置删除按钮
+            self.delete_btn.place(relx=0.5, rely=0.5, anchor='center')
 
         def on_leave(event):
-            # 检查鼠标是否真的离开了整个图片区域
-            x, y = event.x_root, event.y_root
-            widget_x = self.image_container.winfo_rootx()
-            widget_y = self.image_container.winfo_rooty()
-            widget_width = self.image_container.winfo_width()
-            widget_height = self.image_container.winfo_height()
-
-            # 如果鼠标不在图片容器范围内，隐藏删除按钮
-            if not (widget_x <= x <= widget_x + widget_width and
-                    widget_y <= y <= widget_y + widget_height):
+            # 移入子组件（图片、删除按钮）时容器同样会收到 <Leave>，
+            # 此时坐标仍在容器范围内，不隐藏删除按钮
+            width, height = self._container_size
+            if not (0 <= event.x < width and 0 <= event.y < height):
                 self.delete_btn.place_forget()
 
-        # 为图片容器和图片标签绑定事件
+        # 只在最外层的图片容器上绑定，子组件的进出由容器统一处理
+        self.image_container.bind('<Configure>', on_configure)
         self.image_container.bind('<Enter>', on_enter)
         self.image_container.bind('<Leave>', on_leave)
-        self.img_label.bind('<Enter>', on_enter)
-        self.img_label.bind('<Leave>', on_leave)
 
-        # 为删除按钮也绑定事件，防止按钮消失
-        if hasattr(self, 'delete_btn'):
-            self.delete_btn.bind('<Enter>', on_enter)
-            self.delete_btn.bind('<Leave>', on_leave)
+
+# 画廊画布的绑定标签及滚轮单步刻度
+_GALLERY_CANVAS_TAG = 'ImageGalleryCanvas'
+_WHEEL_DELTA = 120
+
+
+def _gallery_on_mousewheel(event):
+    """画廊画布的鼠标滚轮处理（水平滚动）"""
+    delta = event.delta
+    # 整数运算，结果与 int(-delta / 120) 的向零取整一致
+    units = -(delta // _WHEEL_DELTA) if delta >= 0 else -delta // _WHEEL_DELTA
+    if units:
+        event.widget.xview_scroll(units, "units")
 
 
 class ImageGallery(tk.Frame):
@@ -370,68 +560,100 @@ class ImageGallery(tk.Frame):
         self.images = []
         self.on_image_remove = None
 
-        self.configure(bg=self.theme.get_color('bg_primary'))
+        # 与 self.images 一一对应的预览卡片
+        self._card_widgets: List[ImagePreviewCard] = []
+
+        # 已移除图片的隐藏卡片，添加图片时优先复用
+        self._card_pool: List[ImagePreviewCard] = []
+
+        color = self.theme.get_color
+        bg_primary = color('bg_primary')
+        bg_secondary = color('bg_secondary')
+
+        self.configure(bg=bg_primary)
 
         # 创建滚动画布 - 进一步减少高度
         self.canvas = tk.Canvas(
             self,
             height=135,  # 进一步减少高度到120像素
-            bg=self.theme.get_color('bg_secondary'),
-            highlightbackground=self.theme.get_color('border'),
+            bg=bg_secondary,
+            highlightbackground=color('border'),
             highlightthickness=1
         )
 
         # 只创建水平滚动条
         self.scrollbar = tk.Scrollbar(
             self, orient="horizontal", command=self.canvas.xview,
-            bg=self.theme.get_color('bg_secondary'),
-            troughcolor=self.theme.get_color('bg_primary'),
-            activebackground=self.theme.get_color('accent')
+            bg=bg_secondary,
+            troughcolor=bg_primary,
+            activebackground=color('accent')
         )
 
         self.gallery_frame = tk.Frame(
             self.canvas,
-            bg=self.theme.get_color('bg_secondary')
+            bg=bg_secondary
         )
 
+        # 画布与内容宽度由 <Configure> 事件维护，滚动条显隐据此判断，无需强制布局
+        self._canvas_width = 0
+        self._content_width = 0
+        self._scrollbar_state = None
+
         # 配置滚动
-        self.gallery_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(
-                scrollregion=self.canvas.bbox("all"))
-        )
+        self.gallery_frame.bind("<Configure>", self._on_content_configure)
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
 
         self.canvas.create_window(
             (0, 0), window=self.gallery_frame, anchor="nw"
         )
         self.canvas.configure(xscrollcommand=self.scrollbar.set)
 
-        # 布局组件
+        # 布局组件（滚动条按需显示）
         self.canvas.pack(side="top", fill="x")
-        self.scrollbar.pack(side="bottom", fill="x")
 
-        # 绑定鼠标滚轮事件（水平滚动）
-        def _on_mousewheel(event):
-            self.canvas.xview_scroll(int(-1*(event.delta/120)), "units")
+        # 绑定鼠标滚轮事件（水平滚动），通过类绑定所有画廊画布共享同一组处理函数
+        self.canvas.bindtags((_GALLERY_CANVAS_TAG,) + self.canvas.bindtags())
+        if not self.canvas.bind_class(_GALLERY_CANVAS_TAG):
+            self.canvas.bind_class(
+                _GALLERY_CANVAS_TAG, "<MouseWheel>", _gallery_on_mousewheel)  # Windows
+            self.canvas.bind_class(
+                _GALLERY_CANVAS_TAG, "<Button-4>",
+                lambda e: e.widget.xview_scroll(-1, "units"))  # Linux
+            self.canvas.bind_class(
+                _GALLERY_CANVAS_TAG, "<Button-5>",
+                lambda e: e.widget.xview_scroll(1, "units"))   # Linux
+
+        # 空状态提示（创建一次，按需显示或隐藏）
+        self._empty_label = self.theme.create_styled_label(
+            self.gallery_frame, get_text('no_images_selected'), style='small'
+        )
+        self._empty_label.configure(
+            bg=bg_secondary,
+            fg=color('text_secondary')
+        )
 
-        self.canvas.bind("<MouseWheel>", _on_mousewheel)  # Windows
-        self.canvas.bind(
-            "<Button-4>", lambda e: self.canvas.xview_scroll(-1, "units"))  # Linux
-        self.canvas.bind(
-            "<Button-5>", lambda e: self.canvas.xview_scroll(1, "units"))   # Linux
+        # 上次显示时是否有图片（None 表示尚未显示）
+        self._populated = None
 
         # 初始显示
         self._update_display()
 
-    def add_image(self, image_data: dict):
-        """添加图片"""
+    def add_image(self, image_data: Union['ImageEntry', dict]):
+        """添加图片（兼容图片数据字典）"""
+        if not isinstance(image_data, ImageEntry):
+            image_data = ImageEntry.from_dict(image_data)
         self.images.append(image_data)
+        self._create_card(image_data)
         self._update_display()
 
     def remove_image(self, index: int):
         """移除图片"""
         if 0 <= index < len(self.images):
             self.images.pop(index)
+
+            # 隐藏卡片并放回复用池，不销毁控件
+            self._recycle_card(self._card_widgets.pop(index))
+
             self._update_display()
             if self.on_image_remove:
                 self.on_image_remove(index)
@@ -439,67 +661,90 @@ class ImageGallery(tk.Frame):
     def clear_images(self):
         """清空所有图片"""
         self.images.clear()
+        for card in self._card_widgets:
+            card.destroy()
+        self._card_widgets.clear()
+        self._update_display()
+
+    def reset_to_pool(self):
+        """清空所有图片，预览卡片放回复用池以便之后添加图片时复用"""
+        self.images.clear()
+        for card in self._card_widgets:
+            self._recycle_card(card)
+        self._card_widgets.clear()
         self._update_display()
 
-    def get_images(self) -> List[dict]:
+    def _recycle_card(self, card: 'ImagePreviewCard'):
+        """隐藏卡片、释放图片引用并放回复用池"""
+        card.pack_forget()
+        card.release_image()
+        self._card_pool.append(card)
+
+    def _create_card(self, image_data: 'ImageEntry'):
+        """为新图片创建（或从复用池取出）预览卡片并追加到末尾"""
+        if self._card_pool:
+            card = self._card_pool.pop()
+            card.set_image_data(image_data)
+        else:
+            # 删除时按卡片对象查找当前位置，前面的图片被删除后索引依然正确
+            card = ImagePreviewCard(
+                self.gallery_frame,
+                image_data,
+                on_remove=lambda: self._on_card_remove(card)
+            )
+        card.pack(side=tk.LEFT, padx=8, pady=8)
+        self._card_widgets.append(card)
+
+    def _on_card_remove(self, card: 'ImagePreviewCard'):
+        """预览卡片的删除按钮回调"""
+        if card in self._card_widgets:
+            self.remove_image(self._card_widgets.index(card))
+
+    def get_images(self) -> List['ImageEntry']:
         """获取所有图片数据"""
         return self.images.copy()
 
     def _update_display(self):
-        """更新显示"""
-        # 清除现有组件
-        for widget in self.gallery_frame.winfo_children():
-            widget.destroy()
+        """更新显示（预览卡片由增删操作单独维护，这里只切换空状态和滚动条）"""
+        populated = bool(self.images)
+        if populated == self._populated:
+            # 空/非空状态未变化，宽度变化引起的滚动条更新由 <Configure> 负责
+            return
+        self._populated = populated
 
-        if not self.images:
+        if not populated:
             # 显示空状态
-            empty_label = self.theme.create_styled_label(
-                self.gallery_frame, get_text('no_images_selected'), style='small'
-            )
-            empty_label.configure(
-                bg=self.theme.get_color('bg_secondary'),
-                fg=self.theme.get_color('text_secondary')
-            )
-            empty_label.pack(pady=50)  # 调整垂直居中的间距
-
-            # 隐藏滚动条
-            self.scrollbar.pack_forget()
+            self._empty_label.pack(pady=50)  # 调整垂直居中的间距
         else:
-            # 水平排列图片
-            for i, img_data in enumerate(self.images):
-                preview_card = ImagePreviewCard(
-                    self.gallery_frame,
-                    img_data,
-                    on_remove=lambda idx=i: self.remove_image(idx)
-                )
-                preview_card.pack(side=tk.LEFT, padx=8, pady=8)
+            self._empty_label.pack_forget()
 
-            # 更新滚动区域
-            self.gallery_frame.update_idletasks()
-            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        # 滚动区域随内容的 <Configure> 事件更新，这里只按已知宽度判断滚动条
+        self._check_scrollbar_needed()
 
-            # 检查是否需要滚动条
+    def _on_content_configure(self, event):
+        """内容尺寸变化时更新滚动区域"""
+        self.canvas.configure(scrollregion=(0, 0, event.width, event.height))
+        if event.width != self._content_width:
+            self._content_width = event.width
             self._check_scrollbar_needed()
 
-    def _check_scrollbar_needed(self):
-        """检查是否需要显示滚动条"""
-        try:
-            # 等待布局完成
-            self.update_idletasks()
-
-            # 获取内容宽度和画布宽度
-            canvas_width = self.canvas.winfo_width()
-            content_width = self.gallery_frame.winfo_reqwidth()
+    def _on_canvas_configure(self, event):
+        """画布宽度变化时重新判断滚动条"""
+        if event.width != self._canvas_width:
+            self._canvas_width = event.width
+            self._check_scrollbar_needed()
 
-            # 只有当内容宽度超过画布宽度时才显示滚动条
-            if content_width > canvas_width:
-                self.scrollbar.pack(side="bottom", fill="x")
-            else:
-                self.scrollbar.pack_forget()
+    def _check_scrollbar_needed(self):
+        """检查是否需要显示滚动条（只有当内容宽度超过画布宽度时才显示）"""
+        state = (bool(self.images), self._canvas_width, self._content_width)
+        if state == self._scrollbar_state:
+            return
+        self._scrollbar_state = state
 
-        except Exception as e:
-            # 如果出错，默认显示滚动条
+        if self.images and self._content_width > self._canvas_width:
             self.scrollbar.pack(side="bottom", fill="x")
+        else:
+            self.scrollbar.pack_forget()
 
 
 class MacOSWindow(tk.Tk):
@@ -508,14 +753,15 @@ class MacOSWindow(tk.Tk):
     def __init__(self, title: str = "", **kwargs):
         super().__init__(**kwargs)
 
+        # 在创建任何子组件、进入事件循环之前确定窗口大小和位置，
+        # 窗口首次映射时即在最终位置，无需先隐藏再显示
+        self._center_window()
+
         # 设置窗口标题
         if not title:
             title = get_text('window_title')
         self.title(title)
 
-        # 先隐藏窗口，避免闪烁
-        self.withdraw()
-
         # 设置主题
         self.theme = DarkThemeManager
         self.configure(bg=self.theme.get_color('bg_primary'))
@@ -524,12 +770,6 @@ class MacOSWindow(tk.Tk):
         self.resizable(True, True)
         self.minsize(500, 550)  # 调整最小尺寸
 
-        # 计算居中位置并设置窗口大小和位置
-        self._center_window()
-
-        # 显示窗口
-        self.deiconify()
-
         # 设置窗口图标（如果有的话）
         try:
             # 这里可以设置窗口图标
@@ -544,8 +784,7 @@ class MacOSWindow(tk.Tk):
         window_height = 580  # 减少高度
 
         # 获取屏幕尺寸
-        screen_width = self.winfo_screenwidth()
-        screen_height = self.winfo_screenheight()
+        screen_width, screen_height = screen_size(self)
 
         # 计算居中位置
         x = (screen_width // 2) - (window_width // 2)
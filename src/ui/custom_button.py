@@ -2,6 +2,7 @@
 自定义按钮组件 - 使用Canvas绘制避免系统样式干扰
 """
 
+import functools
 import tkinter as tk
 from tkinter import font
 
@@ -11,6 +12,50 @@ except ImportError:
     from ui.theme import DarkThemeManager
 
 
+# 按钮配色方案（所有按钮共享，导入时构建一次）
+_COLOR_SCHEMES = {
+    'primary': {
+        'bg': '#007acc',
+        'fg': '#ffffff',
+        'hover_bg': '#005a9e',
+        'pressed_bg': '#004578'
+    },
+    'secondary': {
+        'bg': '#3e3e42',
+        'fg': '#ffffff',
+        'hover_bg': '#4a4a4f',
+        'pressed_bg': '#2e2e32'
+    },
+    'success': {
+        'bg': '#34C759',
+        'fg': '#ffffff',
+        'hover_bg': '#28A745',
+        'pressed_bg': '#1E7E34'
+    },
+    'danger': {
+        'bg': '#FF3B30',
+        'fg': '#ffffff',
+        'hover_bg': '#D70015',
+        'pressed_bg': '#B50012'
+    }
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _rounded_points(x1, y1, x2, y2, radius):
+    """计算圆角矩形的多边形顶点（相同尺寸的按钮共享结果）"""
+    points = []
+
+    # 计算圆角点
+    for x, y in [(x1, y1 + radius), (x1, y1), (x1 + radius, y1),
+                 (x2 - radius, y1), (x2, y1), (x2, y1 + radius),
+                 (x2, y2 - radius), (x2, y2), (x2 - radius, y2),
+                 (x1 + radius, y2), (x1, y2), (x1, y2 - radius)]:
+        points.extend([x, y])
+
+    return tuple(points)
+
+
 class CustomButton(tk.Canvas):
     """完全自定义的按钮组件，使用Canvas绘制"""
 
@@ -48,81 +93,55 @@ class CustomButton(tk.Canvas):
 
     def _get_colors(self):
         """获取按钮颜色配置"""
-        color_schemes = {
-            'primary': {
-                'bg': '#007acc',
-                'fg': '#ffffff',
-                'hover_bg': '#005a9e',
-                'pressed_bg': '#004578'
-            },
-            'secondary': {
-                'bg': '#3e3e42',
-                'fg': '#ffffff',
-                'hover_bg': '#4a4a4f',
-                'pressed_bg': '#2e2e32'
-            },
-            'success': {
-                'bg': '#34C759',
-                'fg': '#ffffff',
-                'hover_bg': '#28A745',
-                'pressed_bg': '#1E7E34'
-            },
-            'danger': {
-                'bg': '#FF3B30',
-                'fg': '#ffffff',
-                'hover_bg': '#D70015',
-                'pressed_bg': '#B50012'
-            }
-        }
-        return color_schemes.get(self.style, color_schemes['primary'])
+        return _COLOR_SCHEMES.get(self.style, _COLOR_SCHEMES['primary'])
 
     def _draw(self):
-        """绘制按钮"""
-        self.delete("all")
-
-        # 确定当前颜色
-        if self.is_pressed:
-            bg_color = self.colors['pressed_bg']
-        elif self.is_hovered:
-            bg_color = self.colors['hover_bg']
-        else:
-            bg_color = self.colors['bg']
-
-        fg_color = self.colors['fg']
+        """绘制按钮（仅创建一次画布元素）"""
+        # 同一顶层窗口内的按钮共享文字字体（字体属于创建它的 Tk 解释器）
+        toplevel = self.winfo_toplevel()
+        text_font = getattr(toplevel, '_button_text_font', None)
+        if text_font is None:
+            text_font = font.Font(root=toplevel, family="SF Pro Display",
+                                  size=13, weight="normal")
+            toplevel._button_text_font = text_font
 
         # 绘制圆角矩形背景
-        self._draw_rounded_rect(2, 2, self.width-2, self.height-2,
-                                radius=6, fill=bg_color)
+        self._bg_item = self._draw_rounded_rect(
+            2, 2, self.width-2, self.height-2,
+            radius=6, fill=self._current_bg())
 
         # 绘制文字
-        text_font = font.Font(family="SF Pro Display",
-                              size=13, weight="normal")
-        self.create_text(self.width//2, self.height//2,
-                         text=self.text, fill=fg_color,
-                         font=text_font, anchor="center")
+        self._text_item = self.create_text(
+            self.width//2, self.height//2,
+            text=self.text, fill=self.colors['fg'],
+            font=text_font, anchor="center")
 
-    def _draw_rounded_rect(self, x1, y1, x2, y2, radius=10, **kwargs):
-        """绘制圆角矩形"""
-        points = []
+    def _current_bg(self):
+        """根据状态确定当前背景色"""
+        if self.is_pressed:
+            return self.colors['pressed_bg']
+        if self.is_hovered:
+            return self.colors['hover_bg']
+        return self.colors['bg']
 
-        # 计算圆角点
-        for x, y in [(x1, y1 + radius), (x1, y1), (x1 + radius, y1),
-                     (x2 - radius, y1), (x2, y1), (x2, y1 + radius),
-                     (x2, y2 - radius), (x2, y2), (x2 - radius, y2),
-                     (x1 + radius, y2), (x1, y2), (x1, y2 - radius)]:
-            points.extend([x, y])
+    def _update_bg(self):
+        """状态变化时只更新背景色"""
+        self.itemconfig(self._bg_item, fill=self._current_bg())
 
+    def _draw_rounded_rect(self, x1, y1, x2, y2, radius=10, **kwargs):
+        """绘制圆角矩形"""
+        points = _rounded_points(x1, y1, x2, y2, radius)
         return self.create_polygon(points, smooth=True, **kwargs)
 
     def _on_click(self, event):
         """点击事件"""
         self.is_pressed = True
-        self._draw()
+        self._update_bg()
 
     def _on_release(self, event):
         """释放事件"""
         self.is_pressed = False
-        self._draw()
+        self._update_bg()
         if self.command:
             self.command()
 
@@ -130,14 +149,14 @@ class CustomButton(tk.Canvas):
         """鼠标进入"""
         self.is_hovered = True
         self.configure(cursor="hand2")
-        self._draw()
+        self._update_bg()
 
     def _on_leave(self, event):
         """鼠标离开"""
         self.is_hovered = False
         self.is_pressed = False
         self.configure(cursor="")
-        self._draw()
+        self._update_bg()
 
     def configure_command(self, command):
         """设置命令"""
@@ -3,8 +3,11 @@
 采用深色主题和macOS风格设计
 """
 
+import time
+import asyncio
 import tkinter as tk
-from tkinter import messagebox
+import _tkinter
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Dict, Any
 
 try:
@@ -12,12 +15,14 @@ try:
     from .theme import DarkThemeManager
     from .components import MacOSCard, MacOSTextArea, ImageGallery
     from .custom_button import CustomButton
-    from ..core.feedback_collector import FeedbackCollector
+    from ..core.feedback_collector import FeedbackCollector, FeedbackData
     from ..core.image_handler import ImageHandler
     from ..utils.gui_utils import (
         validate_gui_environment,
         setup_macos_style,
         bind_escape_to_close,
+        screen_size,
+        is_macos,
         window_manager
     )
     from ..utils.i18n import get_text
@@ -26,17 +31,49 @@ except ImportError:
     from ui.theme import DarkThemeManager
     from ui.components import MacOSCard, MacOSTextArea, ImageGallery
     from ui.custom_button import CustomButton
-    from core.feedback_collector import FeedbackCollector
+    from core.feedback_collector import FeedbackCollector, FeedbackData
     from core.image_handler import ImageHandler
     from utils.gui_utils import (
         validate_gui_environment,
         setup_macos_style,
         bind_escape_to_close,
+        screen_size,
+        is_macos,
         window_manager
     )
     from utils.i18n import get_text
 
 
+# 布局间距、颜色和字体（主题为静态配置，导入时解析一次）
+SPACING_V = DarkThemeManager.get_size('spacing_v')
+SPACING_H = DarkThemeManager.get_size('spacing_h')
+BG_PRIMARY = DarkThemeManager.get_color('bg_primary')
+BG_SECONDARY = DarkThemeManager.get_color('bg_secondary')
+TEXT_PRIMARY = DarkThemeManager.get_color('text_primary')
+FONT_BODY = DarkThemeManager.get_font('body')
+
+# asyncio 模式下处理Tk事件的间隔（秒）
+_ASYNC_TICK_SECONDS = 0.02
+
+# 主线程检查后台任务的间隔（毫秒）
+_BACKGROUND_POLL_MS = 15
+
+# 后台任务的最长等待时间（秒），超时后放弃该任务，不再阻止提交
+_BACKGROUND_TIMEOUT_SECONDS = 30
+
+# 状态提示自动清除的延迟（毫秒）
+_STATUS_CLEAR_MS = 3000
+
+
+def __getattr__(name):
+    """延迟导入 messagebox（兼容旧的 feedback_dialog.messagebox 访问方式）"""
+    if name == 'messagebox':
+        from tkinter import messagebox
+        globals()['messagebox'] = messagebox
+        return messagebox
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class ModernFeedbackDialog:
     """反馈收集对话框"""
 
@@ -58,6 +95,17 @@ class ModernFeedbackDialog:
         self.result = None
         self.is_hidden = False
         self.timeout_job = None
+        self._status_job = None
+
+        # 本次显示后是否输入过文字或增删过图片，未变化时取消无需检查内容
+        self._dirty = False
+
+        # 图片读取和解码的后台线程池
+        self._pool = ThreadPoolExecutor(max_workers=2)
+
+        # 显示次数编号（每次重置时递增，丢弃上次显示遗留的后台结果）与未完成的后台任务数
+        self._session = 0
+        self._pending = 0
 
         # 创建窗口（但不显示）
         self._create_window_once()
@@ -65,43 +113,101 @@ class ModernFeedbackDialog:
     def show_dialog(self) -> Optional[Dict[str, Any]]:
         """显示对话框并返回结果"""
         try:
-            # 验证GUI环境
-            is_valid, message = validate_gui_environment()
-            if not is_valid:
-                raise Exception(message)
+            self._begin_dialog()
+
+            # 在Tk事件循环中等待，直到窗口被隐藏（提交、取消或超时）或被销毁
+            if not self.is_hidden and self._alive:
+                self.window.wait_variable(self._done_var)
 
-            # 重置状态
-            self._reset_dialog_state()
+            self._end_dialog()
+            return self.result
 
-            # 显示窗口
-            self._show_window()
+        except Exception as e:
+            return self._error_result(e)
 
-            # 设置超时
-            if self.timeout_seconds > 0:
-                self.timeout_job = self.window.after(
-                    self.timeout_seconds * 1000, self._on_timeout)
+    async def show_dialog_async(self) -> Optional[Dict[str, Any]]:
+        """在 asyncio 事件循环中显示对话框并返回结果
 
-            # 运行主循环直到窗口被隐藏
-            while not self.is_hidden and self.window.winfo_exists():
-                try:
-                    self.window.update()
-                except tk.TclError:
-                    break
+        Tk 事件由事件循环按固定间隔处理，等待期间其他协程可以继续运行
+        """
+        loop = asyncio.get_running_loop()
+        done = asyncio.Event()
 
-            # 取消超时任务
-            if self.timeout_job:
-                self.window.after_cancel(self.timeout_job)
-                self.timeout_job = None
+        def on_done_changed(*args):
+            if self._done_var.get():
+                loop.call_soon_threadsafe(done.set)
+
+        trace_id = self._done_var.trace_add('write', on_done_changed)
+        try:
+            self._begin_dialog()
 
+            # 等待窗口被隐藏（提交、取消或超时）或被销毁
+            if not self.is_hidden and self._alive:
+                self._pump_tk_events(loop, done)
+                await done.wait()
+
+            self._end_dialog()
             return self.result
 
         except Exception as e:
-            error_msg = get_text('gui_error', str(e))
-            print(error_msg)
-            return {
-                'success': False,
-                'message': error_msg
-            }
+            return self._error_result(e)
+
+        finally:
+            if self.window:
+                self._done_var.trace_remove('write', trace_id)
+
+    def _pump_tk_events(self, loop: asyncio.AbstractEventLoop, done: asyncio.Event):
+        """处理所有待处理的Tk事件，对话框结束前按固定间隔重新调度"""
+        if not self._alive:
+            done.set()
+            return
+
+        try:
+            while self.window.tk.dooneevent(_tkinter.DONT_WAIT):
+                pass
+        except tk.TclError:
+            # 窗口已被销毁
+            done.set()
+            return
+
+        if not done.is_set():
+            loop.call_later(_ASYNC_TICK_SECONDS,
+                            self._pump_tk_events, loop, done)
+
+    def _begin_dialog(self):
+        """验证环境、重置状态并显示窗口"""
+        # 验证GUI环境（复用已创建的窗口，无需再创建测试窗口）
+        is_valid, message = validate_gui_environment(self.window)
+        if not is_valid:
+            raise Exception(message)
+
+        # 重置状态
+        self._reset_dialog_state()
+
+        # 显示窗口
+        self._show_window()
+
+        # 设置超时
+        if self.timeout_seconds > 0:
+            self.timeout_job = self.window.after(
+                self.timeout_seconds * 1000, self._on_timeout)
+
+    def _end_dialog(self):
+        """对话框结束后的清理"""
+        # 取消超时任务
+        if self.timeout_job:
+            if self._alive:
+                self.window.after_cancel(self.timeout_job)
+            self.timeout_job = None
+
+    def _error_result(self, error: Exception) -> Dict[str, Any]:
+        """构建对话框出错时的结果"""
+        error_msg = get_text('gui_error', str(error))
+        print(error_msg)
+        return {
+            'success': False,
+            'message': error_msg
+        }
 
     def _create_window_once(self):
         """一次性创建窗口（不显示）"""
@@ -115,13 +221,19 @@ class ModernFeedbackDialog:
         # 先隐藏窗口
         self.window.withdraw()
 
+        # 窗口隐藏时置位，show_dialog 等待该变量而不是轮询窗口状态
+        self._done_var = tk.BooleanVar(master=self.window, value=False)
+
+        # 窗口是否仍然存在，由 <Destroy> 事件维护，无需调用 winfo_exists()
+        self._alive = True
+        self.window.bind('<Destroy>', self._on_window_destroy, add='+')
+
         # 设置窗口属性
         self.window.resizable(True, True)
         self.window.minsize(500, 650)  # 增加最小高度从550到650
 
         # 设置主题
-        theme = DarkThemeManager
-        self.window.configure(bg=theme.get_color('bg_primary'))
+        self.window.configure(bg=BG_PRIMARY)
 
         window_manager.register_window(self.window)
 
@@ -132,15 +244,20 @@ class ModernFeedbackDialog:
         self.window.protocol("WM_DELETE_WINDOW", self._on_cancel)
         bind_escape_to_close(self.window, self._on_cancel)
 
-        # 绑定快捷键 Command+Enter 提交反馈
-        self.window.bind('<Command-Return>', lambda e: self._on_submit())
+        if is_macos():
+            self._topmost = False
+            self.window.bind('<FocusOut>', self._on_focus_out)
+
+        # 绑定快捷键 Command+Enter 提交反馈（子组件的按键事件经绑定标签传递到窗口，
+        # 只需在窗口上绑定一次）
+        self.window.bind('<Command-Return>', self._on_submit_shortcut)
         self.window.bind('<Control-Return>',
-                         lambda e: self._on_submit())  # 兼容其他系统
+                         self._on_submit_shortcut)  # 兼容其他系统
 
         # 创建主容器
         main_container = tk.Frame(
             self.window,
-            bg=theme.get_color('bg_primary')
+            bg=BG_PRIMARY
         )
         main_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
 
@@ -152,14 +269,11 @@ class ModernFeedbackDialog:
 
     def _setup_window_geometry(self):
         """设置窗口几何属性"""
-        # 更新窗口以计算实际尺寸
-        self.window.update_idletasks()
-
+        # 窗口大小为固定值，无需先强制布局计算实际尺寸
         # 设置窗口大小和居中位置
         window_width = 550
         window_height = 680  # 增加默认高度从580到680
-        screen_width = self.window.winfo_screenwidth()
-        screen_height = self.window.winfo_screenheight()
+        screen_width, screen_height = screen_size(self.window)
         x = (screen_width // 2) - (window_width // 2)
         y = (screen_height // 2) - (window_height // 2)
 
@@ -177,21 +291,44 @@ class ModernFeedbackDialog:
             self.window.lift()
             self.window.focus_force()
 
-            # 确保窗口在前台
-            self.window.attributes('-topmost', True)
-            self.window.after(
-                100, lambda: self.window.attributes('-topmost', False))
+            # macOS 上 lift 无法将窗口提到其他应用之上，临时置顶，失去焦点时取消
+            if is_macos():
+                self.window.attributes('-topmost', True)
+                self._topmost = True
+
+    def _on_window_destroy(self, event):
+        """窗口被销毁时结束等待"""
+        # 子组件的 <Destroy> 也会传到窗口，只处理窗口自身
+        if event.widget is not self.window:
+            return
+        self._alive = False
+        try:
+            self._done_var.set(True)
+        except tk.TclError:
+            pass
+
+    def _on_focus_out(self, event):
+        """窗口失去焦点后取消临时置顶"""
+        if self._topmost:
+            self._topmost = False
+            self.window.attributes('-topmost', False)
 
     def _hide_window(self):
         """隐藏窗口"""
         if self.window and not self.is_hidden:
             self.is_hidden = True
             self.window.withdraw()
+            self._done_var.set(True)
 
     def _reset_dialog_state(self):
         """重置对话框状态"""
         self.result = None
         self.is_hidden = False
+        self._done_var.set(False)
+
+        # 上次显示中未完成的后台任务结果不再使用
+        self._session += 1
+        self._pending = 0
 
         # 重置反馈收集器
         self.feedback_collector.reset()
@@ -201,7 +338,15 @@ class ModernFeedbackDialog:
             self.text_area.set_text("")
 
         if self.image_gallery:
-            self.image_gallery.clear_images()
+            # 保留预览卡片供下次显示复用
+            self.image_gallery.reset_to_pool()
+
+        self._dirty = False
+
+        # 清除上次显示留下的状态提示
+        if self._status_job:
+            self.window.after_cancel(self._status_job)
+        self._clear_status()
 
         # 保持用户的自动附加偏好设置，而不是重置为默认值
         if self.auto_append_var:
@@ -212,8 +357,7 @@ class ModernFeedbackDialog:
         """创建用户界面"""
         # 创建主内容区域
         content_frame = self.theme.create_styled_frame(parent)
-        content_frame.pack(fill=tk.BOTH, expand=True, pady=(
-            0, self.theme.get_size('spacing_v')))
+        content_frame.pack(fill=tk.BOTH, expand=True, pady=(0, SPACING_V))
 
         # 文字反馈区域
         self._create_text_feedback_section(content_frame)
@@ -234,8 +378,7 @@ class ModernFeedbackDialog:
         """创建文字反馈区域"""
         # 文字反馈卡片
         text_card = MacOSCard(parent, get_text('text_feedback_title'))
-        text_card.pack(fill=tk.X, pady=(
-            0, self.theme.get_size('spacing_v')))
+        text_card.pack(fill=tk.X, pady=(0, SPACING_V))
 
         # 文本输入区域 - 减少高度
         self.text_area = MacOSTextArea(
@@ -244,51 +387,42 @@ class ModernFeedbackDialog:
             height=5  # 减少高度到5行
         )
         self.text_area.pack(fill=tk.X, expand=False)
-
-        # 为文本框绑定快捷键
-        self.text_area.text_widget.bind(
-            '<Command-Return>', lambda e: self._on_submit())
-        self.text_area.text_widget.bind(
-            '<Control-Return>', lambda e: self._on_submit())
+        self.text_area.on_modified = self._mark_dirty
 
     def _create_image_feedback_section(self, parent: tk.Widget):
         """创建图片反馈区域"""
         # 图片反馈卡片
         image_card = MacOSCard(parent, get_text('image_feedback_title'))
-        image_card.pack(fill=tk.X, pady=(0, self.theme.get_size('spacing_v')))
+        image_card.pack(fill=tk.X, pady=(0, SPACING_V))
 
         # 图片操作按钮
         button_frame = self.theme.create_styled_frame(image_card.content_frame)
-        button_frame.pack(fill=tk.X, pady=(
-            0, self.theme.get_size('spacing_h')))
+        button_frame.pack(fill=tk.X, pady=(0, SPACING_H))
 
         # 选择文件按钮
         select_btn = CustomButton(
             button_frame, get_text('select_image_button'), style='primary',
             command=self._select_images, width=100, height=32
         )
-        select_btn.pack(side=tk.LEFT, padx=(
-            0, self.theme.get_size('spacing_h')))
+        select_btn.grid(row=0, column=0, padx=(0, SPACING_H))
 
         # 粘贴按钮
         paste_btn = CustomButton(
             button_frame, get_text('paste_image_button'), style='secondary',
             command=self._paste_image, width=100, height=32
         )
-        paste_btn.pack(side=tk.LEFT, padx=(
-            0, self.theme.get_size('spacing_h')))
+        paste_btn.grid(row=0, column=1, padx=(0, SPACING_H))
 
         # 清除按钮
         clear_btn = CustomButton(
             button_frame, get_text('clear_images_button'), style='danger',
             command=self._clear_images, width=100, height=32
         )
-        clear_btn.pack(side=tk.LEFT)
+        clear_btn.grid(row=0, column=2)
 
         # 图片画廊
         self.image_gallery = ImageGallery(image_card.content_frame)
-        self.image_gallery.pack(fill=tk.X, pady=(
-            self.theme.get_size('spacing_h'), 0))
+        self.image_gallery.pack(fill=tk.X, pady=(SPACING_H, 0))
 
         # 设置图片移除回调
         self.image_gallery.on_image_remove = self._on_image_removed
@@ -297,8 +431,7 @@ class ModernFeedbackDialog:
         """创建自动附加复选框区域"""
         # 自动附加复选框卡片
         auto_append_card = MacOSCard(parent, get_text('auto_append_title'))
-        auto_append_card.pack(fill=tk.X, pady=(
-            0, self.theme.get_size('spacing_v')))
+        auto_append_card.pack(fill=tk.X, pady=(0, SPACING_V))
 
         # 自动附加复选框
         self.auto_append_var = tk.BooleanVar()
@@ -310,13 +443,13 @@ class ModernFeedbackDialog:
             auto_append_card.content_frame,
             text=get_text('auto_append_checkbox'),
             variable=self.auto_append_var,
-            bg=self.theme.get_color('bg_secondary'),
-            fg=self.theme.get_color('text_primary'),
-            selectcolor=self.theme.get_color('bg_primary'),
-            activebackground=self.theme.get_color('bg_secondary'),
-            activeforeground=self.theme.get_color('text_primary'),
+            bg=BG_SECONDARY,
+            fg=TEXT_PRIMARY,
+            selectcolor=BG_PRIMARY,
+            activebackground=BG_SECONDARY,
+            activeforeground=TEXT_PRIMARY,
             relief=tk.FLAT,
-            font=self.theme.get_font('body'),
+            font=FONT_BODY,
             # 添加回调函数来保存用户的选择
             command=self._on_auto_append_changed
         )
@@ -324,34 +457,28 @@ class ModernFeedbackDialog:
 
     def _create_action_buttons(self, parent: tk.Widget):
         """创建操作按钮"""
-        button_frame = self.theme.create_styled_frame(parent)
-        button_frame.pack(fill=tk.X, pady=(
-            self.theme.get_size('spacing_v'), 0))
-
-        # 创建居中容器
-        center_frame = self.theme.create_styled_frame(button_frame)
-        center_frame.pack(expand=True)
+        # 居中的按钮容器（pack 不填充时默认水平居中）
+        center_frame = self.theme.create_styled_frame(parent)
+        center_frame.pack(pady=(SPACING_V, 0))
 
         # 提交按钮
         submit_btn = CustomButton(
             center_frame, get_text('submit_button'), style='primary',
             command=self._on_submit, width=120, height=36
         )
-        submit_btn.pack(side=tk.LEFT, padx=(
-            0, self.theme.get_size('spacing_h')))
+        submit_btn.grid(row=0, column=0, padx=(0, SPACING_H))
 
         # 取消按钮
         cancel_btn = CustomButton(
             center_frame, get_text('cancel_button'), style='secondary',
             command=self._on_cancel, width=120, height=36
         )
-        cancel_btn.pack(side=tk.LEFT)
+        cancel_btn.grid(row=0, column=1)
 
     def _create_info_section(self, parent: tk.Widget):
         """创建提示信息区域"""
         info_frame = self.theme.create_styled_frame(parent)
-        info_frame.pack(fill=tk.X, pady=(
-            self.theme.get_size('spacing_v'), 0))
+        info_frame.pack(fill=tk.X, pady=(SPACING_V, 0))
 
         # 快捷键提示 - 居中对齐，小字体
         shortcut_label = self.theme.create_styled_label(
@@ -367,43 +494,138 @@ class ModernFeedbackDialog:
             )
             timeout_label.pack(anchor='center')  # 改为居中对齐
 
+        # 状态提示 - 非关键的提示信息显示在这里，不弹出模态对话框
+        self._status_var = tk.StringVar(master=self.window)
+        status_label = self.theme.create_styled_label(
+            info_frame, '', style='small'
+        )
+        status_label.configure(
+            textvariable=self._status_var,
+            fg=self.theme.get_color('warning')
+        )
+        status_label.pack(anchor='center')
+
+    def _show_status(self, message: str):
+        """在状态栏显示提示信息，一段时间后自动清除"""
+        self._status_var.set(message)
+        if self._status_job:
+            self.window.after_cancel(self._status_job)
+        self._status_job = self.window.after(
+            _STATUS_CLEAR_MS, self._clear_status)
+
+    def _clear_status(self):
+        """清除状态提示"""
+        self._status_job = None
+        self._status_var.set('')
+
     def _select_images(self):
         """选择图片文件"""
         try:
-            images = self.feedback_collector.select_images()
-            if images:
-                for image_data in images:
-                    self.image_gallery.add_image(image_data)
+            # 文件对话框必须在主线程显示，读取和解码在后台线程进行
+            file_paths = ImageHandler.ask_image_files(self.window)
+            if file_paths:
+                self._run_in_background(
+                    ImageHandler.load_files, self._apply_loaded_files, file_paths)
         except Exception as e:
+            from tkinter import messagebox
             messagebox.showerror(get_text('confirm_title'), str(e))
 
+    def _apply_loaded_files(self, result):
+        """后台加载图片文件完成后添加到画廊"""
+        images, failed_files = result
+        self._apply_images(images)
+        ImageHandler.warn_failed_files(failed_files, self.window)
+
+    def _apply_images(self, images):
+        """将加载完成的图片添加到画廊（超过数量上限的图片不添加）"""
+        room = max(FeedbackData.MAX_IMAGES - len(self.image_gallery.images), 0)
+        if len(images) > room:
+            self._show_status(get_text('too_many_images', FeedbackData.MAX_IMAGES))
+            images = images[:room]
+
+        for image_data in images:
+            self.image_gallery.add_image(image_data)
+        if images:
+            self._mark_dirty()
+
+    def _mark_dirty(self):
+        """标记对话框内容已变化"""
+        self._dirty = True
+
     def _paste_image(self):
         """从剪贴板粘贴图片"""
+        # 读取剪贴板并编码为PNG可能较慢，在后台线程进行
+        self._run_in_background(
+            self.feedback_collector.paste_image_from_clipboard,
+            self._apply_pasted_image)
+
+    def _apply_pasted_image(self, image_data):
+        """后台读取剪贴板完成后添加图片"""
+        if image_data:
+            self._apply_images((image_data,))
+        else:
+            self._show_status(get_text('paste_failed'))
+
+    def _run_in_background(self, func, callback, *args):
+        """在后台线程执行任务，完成后在主线程以结果调用回调"""
+        future = self._pool.submit(func, *args)
+        self._pending += 1
+        deadline = time.monotonic() + _BACKGROUND_TIMEOUT_SECONDS
+        self.window.after(_BACKGROUND_POLL_MS, self._poll_background,
+                          future, callback, self._session, deadline)
+
+    def _poll_background(self, future: Future, callback, session: int,
+                         deadline: float):
+        """在主线程中检查后台任务（Tk 只能在主线程中访问）"""
+        # 窗口已销毁或对话框已重新显示时丢弃结果
+        if not self._alive or session != self._session:
+            return
+
+        if not future.done():
+            if time.monotonic() < deadline:
+                self.window.after(_BACKGROUND_POLL_MS, self._poll_background,
+                                  future, callback, session, deadline)
+                return
+
+            # 任务超时：放弃其结果，不再计入未完成任务，允许用户提交
+            future.cancel()
+            self._pending -= 1
+            self._show_status(get_text('background_timeout'))
+            return
+
+        self._pending -= 1
         try:
-            image_data = self.feedback_collector.paste_image_from_clipboard()
-            if image_data:
-                self.image_gallery.add_image(image_data)
-            else:
-                messagebox.showwarning(
-                    get_text('confirm_title'), get_text('paste_failed'))
+            callback(future.result())
         except Exception as e:
+            from tkinter import messagebox
             messagebox.showerror(get_text('confirm_title'), str(e))
 
     def _clear_images(self):
         """清除所有图片"""
         if self.image_gallery.get_images():
+            from tkinter import messagebox
             if messagebox.askyesno(get_text('confirm_title'), get_text('confirm_clear_images')):
                 self.image_gallery.clear_images()
 
     def _on_image_removed(self, index: int):
         """图片被移除时的回调"""
-        # 图片已经在ImageGallery中被移除，这里不需要额外处理
+        # 图片已经在ImageGallery中被移除，这里只记录内容变化
         # 如果将来需要添加额外的处理逻辑（如日志记录、统计等），可以在此处添加
-        pass
+        self._mark_dirty()
+
+    def _on_submit_shortcut(self, event):
+        """提交快捷键处理，提交后停止事件继续传递"""
+        self._on_submit()
+        return "break"
 
     def _on_submit(self):
         """提交反馈"""
         try:
+            # 图片仍在后台加载时不提交，避免结果中缺少这些图片
+            if self._pending:
+                self._show_status(get_text('images_loading'))
+                return
+
             # 获取文字反馈
             text_feedback = self.text_area.get_text().strip()
 
@@ -420,8 +642,7 @@ class ModernFeedbackDialog:
 
             # 检查是否有反馈内容
             if not text_feedback and not images:
-                messagebox.showwarning(
-                    get_text('confirm_title'), get_text('no_feedback_error'))
+                self._show_status(get_text('no_feedback_error'))
                 return
 
             # 构建结果
@@ -430,7 +651,8 @@ class ModernFeedbackDialog:
                 'has_text': bool(text_feedback),
                 'text_feedback': text_feedback,
                 'has_images': bool(images),
-                'images': [img.get('data') for img in images],
+                # 结果只读，直接使用元组（无图片时为共享的空元组）
+                'images': tuple(img.data for img in images),
                 'message': get_text('submit_success')
             }
 
@@ -438,20 +660,23 @@ class ModernFeedbackDialog:
             self._hide_window()
 
         except Exception as e:
+            from tkinter import messagebox
             messagebox.showerror(get_text('confirm_title'), str(e))
 
     def _on_cancel(self):
         """取消操作"""
         try:
-            # 检查是否有内容
-            has_text = bool(
-                self.text_area and self.text_area.get_text().strip())
-            has_images = bool(
-                self.image_gallery and self.image_gallery.get_images())
-
-            if has_text or has_images:
-                if not messagebox.askyesno(get_text('confirm_title'), get_text('confirm_cancel')):
-                    return
+            # 显示后内容有过变化时才检查是否有内容
+            if self._dirty:
+                has_text = bool(
+                    self.text_area and self.text_area.get_text().strip())
+                has_images = bool(
+                    self.image_gallery and self.image_gallery.get_images())
+
+                if has_text or has_images:
+                    from tkinter import messagebox
+                    if not messagebox.askyesno(get_text('confirm_title'), get_text('confirm_cancel')):
+                        return
 
             self.result = {
                 'success': False,
@@ -488,6 +713,12 @@ class ModernFeedbackDialog:
                     self.window.after_cancel(self.timeout_job)
                     self.timeout_job = None
 
+                # 结束可能仍在进行的等待
+                self._done_var.set(True)
+
+                # 不再等待后台任务
+                self._pool.shutdown(wait=False)
+
                 # 注销窗口
                 window_manager.unregister_window(self.window)
 
@@ -538,8 +769,7 @@ class SimpleImagePickerDialog:
         self.window.grab_set()
 
         # 设置主题
-        theme = DarkThemeManager
-        self.window.configure(bg=theme.get_color('bg_primary'))
+        self.window.configure(bg=BG_PRIMARY)
 
         # 绑定关闭事件
         self.window.protocol("WM_DELETE_WINDOW", self._on_cancel)
@@ -549,8 +779,9 @@ class SimpleImagePickerDialog:
 
         # 居中显示
         self.window.update_idletasks()
-        x = (self.window.winfo_screenwidth() // 2) - (400 // 2)
-        y = (self.window.winfo_screenheight() // 2) - (200 // 2)
+        screen_width, screen_height = screen_size(self.window)
+        x = (screen_width // 2) - (400 // 2)
+        y = (screen_height // 2) - (200 // 2)
         self.window.geometry(f"400x200+{x}+{y}")
 
     def _create_ui(self):
@@ -596,6 +827,7 @@ class SimpleImagePickerDialog:
         try:
             from tkinter import filedialog
             file_path = filedialog.askopenfilename(
+                parent=self.window,
                 title=get_text('select_image_button'),
                 filetypes=[
                     ("图片文件", "*.png *.jpg *.jpeg *.gif *.bmp"),
@@ -606,10 +838,12 @@ class SimpleImagePickerDialog:
                 self.result = ImageHandler.load_image_as_bytes(file_path)
                 self._close_window()
         except Exception as e:
+            from tkinter import messagebox
             messagebox.showerror(get_text('confirm_title'), str(e))
 
     def _paste_clipboard(self):
         """粘贴剪贴板"""
+        from tkinter import messagebox
         try:
             image_data = ImageHandler.get_clipboard_image()
             if image_data:
@@ -3,62 +3,124 @@
 提供与Cursor Default Dark Modern主题一致的颜色配置
 """
 
+import functools
 import tkinter as tk
 from tkinter import ttk
+from types import MappingProxyType
 from typing import Dict, Any
 
 
 class DarkThemeManager:
     """深色主题管理器"""
 
-    # Cursor风格深色主题颜色配置 - 优化对比度
-    COLORS = {
-        'bg_primary': '#1e1e1e',      # 主背景
-        'bg_secondary': '#2d2d30',    # 卡片背景
-        'bg_tertiary': '#3e3e42',     # 三级背景
-        'accent': '#007acc',          # 强调色（蓝色）
-        'text_primary': '#ffffff',    # 主要文字 - 最高对比度
-        'text_secondary': '#d4d4d4',  # 次要文字 - 提高对比度
-        'border': '#464647',          # 边框
-        'success': '#4ec9b0',         # 成功色
-        'warning': '#ffcc02',         # 警告色
-        'error': '#f44747',           # 错误色
-        'hover': '#005a9e',           # 悬停色 - 提高对比度
-        'active': '#1177bb',          # 激活色
-    }
-
-    # 字体配置
-    FONTS = {
-        'title': ('SF Pro Display', 18, 'bold'),
-        'subtitle': ('SF Pro Display', 14, 'normal'),
-        'body': ('SF Pro Text', 14, 'normal'),
-        'button': ('SF Pro Text', 12, 'normal'),
-        'small': ('SF Pro Text', 10, 'normal'),
-    }
-
-    # 尺寸配置 - 优化布局
-    SIZES = {
-        'window_width': 550,
-        'window_height': 580,         # 进一步减少窗口高度到580
-        'padding': 20,
-        'spacing_v': 10,              # 进一步减少垂直间距
-        'spacing_h': 12,
-        'border_radius': 8,
-        'button_radius': 6,
-        'input_radius': 4,
-    }
+    # Cursor风格深色主题颜色 - 优化对比度
+    BG_PRIMARY = '#1e1e1e'        # 主背景
+    BG_SECONDARY = '#2d2d30'      # 卡片背景
+    BG_TERTIARY = '#3e3e42'       # 三级背景
+    ACCENT = '#007acc'            # 强调色（蓝色）
+    TEXT_PRIMARY = '#ffffff'      # 主要文字 - 最高对比度
+    TEXT_SECONDARY = '#d4d4d4'    # 次要文字 - 提高对比度
+    BORDER = '#464647'            # 边框
+    SUCCESS = '#4ec9b0'           # 成功色
+    WARNING = '#ffcc02'           # 警告色
+    ERROR = '#f44747'             # 错误色
+    HOVER = '#005a9e'             # 悬停色 - 提高对比度
+    ACTIVE = '#1177bb'            # 激活色
+
+    # 字体
+    FONT_TITLE = ('SF Pro Display', 18, 'bold')
+    FONT_SUBTITLE = ('SF Pro Display', 14, 'normal')
+    FONT_BODY = ('SF Pro Text', 14, 'normal')
+    FONT_BUTTON = ('SF Pro Text', 12, 'normal')
+    FONT_SMALL = ('SF Pro Text', 10, 'normal')
+
+    # 尺寸 - 优化布局
+    WINDOW_WIDTH = 550
+    WINDOW_HEIGHT = 580           # 进一步减少窗口高度到580
+    PADDING = 20
+    SPACING_V = 10                # 进一步减少垂直间距
+    SPACING_H = 12
+    BORDER_RADIUS = 8
+    BUTTON_RADIUS = 6
+    INPUT_RADIUS = 4
+
+    # 按名称查找的配置表（只读，避免运行时修改使下面的缓存失效）
+    COLORS = MappingProxyType({
+        'bg_primary': BG_PRIMARY,
+        'bg_secondary': BG_SECONDARY,
+        'bg_tertiary': BG_TERTIARY,
+        'accent': ACCENT,
+        'text_primary': TEXT_PRIMARY,
+        'text_secondary': TEXT_SECONDARY,
+        'border': BORDER,
+        'success': SUCCESS,
+        'warning': WARNING,
+        'error': ERROR,
+        'hover': HOVER,
+        'active': ACTIVE,
+    })
+
+    FONTS = MappingProxyType({
+        'title': FONT_TITLE,
+        'subtitle': FONT_SUBTITLE,
+        'body': FONT_BODY,
+        'button': FONT_BUTTON,
+        'small': FONT_SMALL,
+    })
+
+    SIZES = MappingProxyType({
+        'window_width': WINDOW_WIDTH,
+        'window_height': WINDOW_HEIGHT,
+        'padding': PADDING,
+        'spacing_v': SPACING_V,
+        'spacing_h': SPACING_H,
+        'border_radius': BORDER_RADIUS,
+        'button_radius': BUTTON_RADIUS,
+        'input_radius': INPUT_RADIUS,
+    })
+
+    # 按钮样式配置（由颜色配置计算一次，只读）
+    _BUTTON_STYLES = MappingProxyType({
+        'primary': {
+            'bg': COLORS['accent'],
+            'fg': '#ffffff',
+            'activebackground': COLORS['active'],
+            'activeforeground': '#ffffff',
+        },
+        'secondary': {
+            'bg': COLORS['bg_tertiary'],
+            'fg': COLORS['text_primary'],
+            'activebackground': COLORS['border'],
+            'activeforeground': COLORS['text_primary'],
+        },
+        'success': {
+            'bg': COLORS['success'],
+            'fg': '#ffffff',
+            'activebackground': '#3da58a',
+            'activeforeground': '#ffffff',
+        },
+        'danger': {
+            'bg': COLORS['error'],
+            'fg': '#ffffff',
+            'activebackground': '#d73a49',
+            'activeforeground': '#ffffff',
+        }
+    })
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_color(cls, color_name: str) -> str:
         """获取颜色值"""
         return cls.COLORS.get(color_name, '#ffffff')
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_font(cls, font_name: str) -> tuple:
         """获取字体配置"""
         return cls.FONTS.get(font_name, ('Arial', 12, 'normal'))
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_size(cls, size_name: str) -> int:
         """获取尺寸配置"""
         return cls.SIZES.get(size_name, 0)
@@ -77,34 +139,7 @@ class DarkThemeManager:
     def create_styled_button(cls, parent: tk.Widget, text: str,
                              command=None, style: str = 'primary') -> tk.Button:
         """创建样式化按钮"""
-        style_configs = {
-            'primary': {
-                'bg': cls.COLORS['accent'],
-                'fg': '#ffffff',
-                'activebackground': cls.COLORS['active'],
-                'activeforeground': '#ffffff',
-            },
-            'secondary': {
-                'bg': cls.COLORS['bg_tertiary'],
-                'fg': cls.COLORS['text_primary'],
-                'activebackground': cls.COLORS['border'],
-                'activeforeground': cls.COLORS['text_primary'],
-            },
-            'success': {
-                'bg': cls.COLORS['success'],
-                'fg': '#ffffff',
-                'activebackground': '#3da58a',
-                'activeforeground': '#ffffff',
-            },
-            'danger': {
-                'bg': cls.COLORS['error'],
-                'fg': '#ffffff',
-                'activebackground': '#d73a49',
-                'activeforeground': '#ffffff',
-            }
-        }
-
-        config = style_configs.get(style, style_configs['primary'])
+        config = cls._BUTTON_STYLES.get(style, cls._BUTTON_STYLES['primary'])
 
         button = tk.Button(
             parent,
@@ -154,18 +189,18 @@ class DarkThemeManager:
     def create_styled_text(cls, parent: tk.Widget, **kwargs) -> tk.Text:
         """创建样式化文本框"""
         default_config = {
-            'bg': cls.COLORS['bg_secondary'],
-            'fg': cls.COLORS['text_primary'],
-            'insertbackground': cls.COLORS['accent'],
-            'selectbackground': cls.COLORS['accent'],
+            'bg': cls.BG_SECONDARY,
+            'fg': cls.TEXT_PRIMARY,
+            'insertbackground': cls.ACCENT,
+            'selectbackground': cls.ACCENT,
             'selectforeground': '#ffffff',
             'relief': tk.FLAT,
             'bd': 0,
-            'font': cls.FONTS['body'],
+            'font': cls.FONT_BODY,
             'wrap': tk.WORD,
             'highlightthickness': 0,
-            'highlightcolor': cls.COLORS['bg_secondary'],
-            'highlightbackground': cls.COLORS['bg_secondary'],
+            'highlightcolor': cls.BG_SECONDARY,
+            'highlightbackground': cls.BG_SECONDARY,
         }
 
         # 合并用户配置
@@ -5,6 +5,7 @@ GUI工具函数
 
 import tkinter as tk
 import sys
+import weakref
 import platform
 from typing import Tuple, Optional, List
 
@@ -16,13 +17,22 @@ except ImportError:
     from ui.theme import DarkThemeManager
 
 
+# GUI 环境是否已确认可用；不可用可能只是暂时的（如显示服务尚未就绪），不记录
+_gui_available = False
+
+
 def check_gui_available() -> bool:
-    """检查GUI环境是否可用"""
+    """检查GUI环境是否可用（确认可用后不再重复创建测试窗口）"""
+    global _gui_available
+    if _gui_available:
+        return True
+
     try:
         # 尝试创建一个测试窗口
         test_root = tk.Tk()
         test_root.withdraw()  # 隐藏窗口
         test_root.destroy()
+        _gui_available = True
         return True
     except Exception:
         return False
@@ -62,8 +72,7 @@ def center_window(window: tk.Tk, width: int, height: int) -> None:
         # 手动计算居中位置
         try:
             window.update_idletasks()
-            screen_width = window.winfo_screenwidth()
-            screen_height = window.winfo_screenheight()
+            screen_width, screen_height = screen_size(window)
 
             x = (screen_width // 2) - (width // 2)
             y = (screen_height // 2) - (height // 2)
@@ -119,16 +128,19 @@ def setup_window_properties(window: tk.Tk, title: str, width: int, height: int,
         print(f"设置窗口属性失败: {e}")
 
 
-def create_tooltip(widget: tk.Widget, text: str) -> None:
-    """为组件创建工具提示"""
-    def on_enter(event):
-        tooltip = tk.Toplevel()
+# 所有工具提示共享的窗口（首次显示时创建，之后只隐藏不销毁）
+_TOOLTIP = {'win': None, 'label': None}
+
+
+def _get_tooltip_window(widget: tk.Widget) -> Tuple[tk.Toplevel, tk.Label]:
+    """获取共享的工具提示窗口，不存在时创建"""
+    if _TOOLTIP['win'] is None:
+        tooltip = tk.Toplevel(widget)
         tooltip.wm_overrideredirect(True)
-        tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
+        tooltip.withdraw()
 
         label = tk.Label(
             tooltip,
-            text=text,
             background="#ffffe0",
             relief=tk.SOLID,
             borderwidth=1,
@@ -136,12 +148,30 @@ def create_tooltip(widget: tk.Widget, text: str) -> None:
         )
         label.pack()
 
-        widget.tooltip = tooltip
+        def on_destroy(event):
+            # 所属的根窗口被销毁时一并失效
+            if event.widget is tooltip:
+                _TOOLTIP['win'] = None
+                _TOOLTIP['label'] = None
+
+        tooltip.bind('<Destroy>', on_destroy)
+        _TOOLTIP['win'] = tooltip
+        _TOOLTIP['label'] = label
+
+    return _TOOLTIP['win'], _TOOLTIP['label']
+
+
+def create_tooltip(widget: tk.Widget, text: str) -> None:
+    """为组件创建工具提示"""
+    def on_enter(event):
+        tooltip, label = _get_tooltip_window(widget)
+        label.configure(text=text)
+        tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
+        tooltip.deiconify()
 
     def on_leave(event):
-        if hasattr(widget, 'tooltip'):
-            widget.tooltip.destroy()
-            del widget.tooltip
+        if _TOOLTIP['win'] is not None:
+            _TOOLTIP['win'].withdraw()
 
     widget.bind('<Enter>', on_enter)
     widget.bind('<Leave>', on_leave)
@@ -156,27 +186,53 @@ def safe_destroy(widget: tk.Widget) -> None:
         print(f"销毁组件失败: {e}")
 
 
+# 屏幕尺寸缓存（每个进程只向 Tk 查询一次）
+_SCREEN = [None]
+
+
+def screen_size(widget: tk.Misc) -> Tuple[int, int]:
+    """通过已有组件获取屏幕尺寸（结果缓存）"""
+    if _SCREEN[0] is None:
+        _SCREEN[0] = (widget.winfo_screenwidth(), widget.winfo_screenheight())
+    return _SCREEN[0]
+
+
 def get_screen_size() -> tuple[int, int]:
     """获取屏幕尺寸"""
     try:
+        if _SCREEN[0] is not None:
+            return _SCREEN[0]
+
+        # 优先使用已注册的窗口查询，避免创建临时的 Tk 实例
+        window = next(iter(window_manager.windows), None)
+        if window is not None:
+            return screen_size(window)
+
         root = tk.Tk()
         root.withdraw()
-        width = root.winfo_screenwidth()
-        height = root.winfo_screenheight()
-        root.destroy()
-        return width, height
+        try:
+            return screen_size(root)
+        finally:
+            root.destroy()
     except Exception:
         return 1920, 1080  # 默认尺寸
 
 
-def validate_gui_environment() -> Tuple[bool, str]:
-    """验证GUI环境"""
+def validate_gui_environment(window: Optional[tk.Misc] = None) -> Tuple[bool, str]:
+    """验证GUI环境
+
+    Args:
+        window: 已创建的窗口；传入时说明GUI可用，并直接用它查询屏幕尺寸
+    """
     try:
-        if not check_gui_available():
+        if window is None and not check_gui_available():
             return False, "GUI环境不可用，请确保在支持图形界面的环境中运行"
 
         # 检查显示器
-        screen_width, screen_height = get_screen_size()
+        if window is not None:
+            screen_width, screen_height = screen_size(window)
+        else:
+            screen_width, screen_height = get_screen_size()
         if screen_width < 800 or screen_height < 600:
             return False, f"屏幕分辨率过低: {screen_width}x{screen_height}，建议至少800x600"
 
@@ -204,16 +260,23 @@ def setup_macos_style(window: tk.Tk) -> None:
 
 
 def handle_dpi_scaling(window: tk.Tk) -> float:
-    """处理DPI缩放"""
+    """处理DPI缩放（每个 Tk 解释器只计算并设置一次字体，之后直接返回缓存的比例）"""
+    # option_add 只作用于当前解释器，缩放比例记录在该解释器的根窗口上
+    root = window.nametowidget('.')
+    dpi_scale = getattr(root, '_dpi_scale', None)
+    if dpi_scale is not None:
+        return dpi_scale
+
     try:
         # 获取DPI缩放比例
         dpi = window.winfo_fpixels('1i')
         scale_factor = dpi / 72.0  # 72 DPI是标准
 
         if scale_factor > 1.0:
-            # 调整字体大小
+            # 调整字体大小（会使整个解释器的字体度量失效，只设置一次）
             window.option_add('*Font', f'Arial {int(12 * scale_factor)}')
 
+        root._dpi_scale = scale_factor
         return scale_factor
 
     except Exception as e:
@@ -225,30 +288,25 @@ class WindowManager:
     """窗口管理器"""
 
     def __init__(self):
-        self.windows = []
+        # 弱引用集合，窗口被回收后自动移除
+        self.windows = weakref.WeakSet()
 
     def register_window(self, window: tk.Tk) -> None:
         """注册窗口"""
-        self.windows.append(window)
+        self.windows.add(window)
 
     def unregister_window(self, window: tk.Tk) -> None:
         """注销窗口"""
-        try:
-            if window in self.windows:
-                self.windows.remove(window)
-        except ValueError:
-            pass  # 窗口不在列表中，忽略
+        self.windows.discard(window)
 
     def close_all_windows(self) -> None:
         """关闭所有窗口"""
-        for window in self.windows:
+        for window in list(self.windows):
             safe_destroy(window)
         self.windows.clear()
 
     def get_window_count(self) -> int:
         """获取窗口数量"""
-        # 清理已销毁的窗口
-        self.windows = [w for w in self.windows if w.winfo_exists()]
         return len(self.windows)
 
 
@@ -1,11 +1,17 @@
 """
 国际化支持模块
 支持中英文切换，通过环境变量LANGUAGE控制
+语言包位于 translations/ 目录，按需加载
 """
 
 import os
+import re
 import sys
-from typing import Dict, Any
+import json
+from collections import ChainMap
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Any, Tuple
 
 # 默认语言
 DEFAULT_LANGUAGE = 'CN'
@@ -13,168 +19,130 @@ DEFAULT_LANGUAGE = 'CN'
 # 当前语言设置
 CURRENT_LANGUAGE = os.getenv('LANGUAGE', DEFAULT_LANGUAGE).upper()
 
-# 语言包
-TRANSLATIONS = {
-    'CN': {
-        # 窗口标题
-        'window_title': '💬 反馈收集器',
-        'image_picker_title': '🖼️ 选择图片',
-
-        # 卡片标题
-        'text_feedback_title': '📝 文字反馈',
-        'image_feedback_title': '🖼️ 图片反馈',
-        'auto_append_title': '⚙️ 自动附加设置',
-
-        # 按钮文本
-        'submit_button': '提交反馈',
-        'cancel_button': '取消',
-        'select_image_button': '选择图片',
-        'paste_image_button': '粘贴图片',
-        'clear_images_button': '清除图片',
-        'select_file_button': '选择文件',
-        'paste_clipboard_button': '粘贴剪贴板',
-
-        # 复选框文本
-        'auto_append_checkbox': '自动附加调用反馈收集器 prompt',
-        'auto_append_content': '以下是你需要非常注意的 2 点：\n1. 对以上用户反馈进行处理（或回答）。\n2. 在处理完（或回答完）以上用户反馈后，必须重新调用 <feedback-collector.collect_feedback> MCP 以获取用户反馈',
-
-        # 占位符文本
-        'text_placeholder': '请在此输入您的反馈、建议或问题...',
-
-        # 提示信息
-        'shortcut_info': '⌨️ 快捷键：⌘+Enter（Ctrl+Enter）提交反馈，ESC 取消',
-        'timeout_info': '⏰ 对话框将在 {} 分钟后自动关闭',
-        'image_picker_info': '选择图片文件或从剪贴板粘贴图片',
-
-        # 错误和状态消息
-        'no_feedback_error': '请输入文字反馈或添加图片',
-        'submit_success': '反馈提交成功！',
-        'operation_cancelled': '操作已取消',
-        'timeout_error': '操作超时（{}秒），请重试',
-        'gui_error': '创建反馈对话框失败: {}',
-        'image_select_cancelled': '未选择图片或操作被取消',
-        'image_select_failed': '图片选择失败: {}',
-        'image_info_failed': '获取图片信息失败: {}',
-        'paste_failed': '粘贴失败，剪贴板中没有图片数据',
-        'file_not_found': '文件不存在: {}',
-        'invalid_image': '无效的图片文件: {}',
-
-        # 确认对话框
-        'confirm_title': '确认',
-        'confirm_cancel': '确定要取消吗？已输入的内容将丢失。',
-        'confirm_clear_images': '确定要清除所有图片吗？',
-
-        # 服务器消息
-        'server_starting': '启动MCP反馈收集器服务器...',
-        'server_stopped': '服务器已停止',
-        'server_start_failed': '服务器启动失败: {}',
-        'env_validation_failed': '环境验证失败: {}',
-        'env_validation_passed': '环境验证通过，服务器启动中...',
-        'feedback_submit_failed': '反馈提交失败: {}',
-        'feedback_cancelled': '用户取消了反馈提交',
-        'collect_feedback_error': 'collect_feedback错误: {}',
-        'feedback_collection_failed': '反馈收集失败: {}',
-        'pick_image_error': 'pick_image错误: {}',
-        'user_text_feedback': '用户文字反馈：{}',
-
-        # 调试信息
-        'debug_collecting_feedback': '开始收集反馈，超时时间: {}秒',
-        'debug_gui_validated': 'GUI环境验证通过',
-        'debug_feedback_success': '反馈收集成功',
-        'debug_feedback_items': '返回 {} 个反馈项',
-        'debug_selecting_image': '开始选择图片',
-        'debug_image_success': '图片选择成功',
-        'debug_getting_image_info': '获取图片信息: {}',
-        'debug_image_info_success': '图片信息获取成功',
-
-        # 图片相关
-        'image_remove_tooltip': '点击删除图片',
-        'image_preview': '图片预览',
-        'images_count': '已添加 {} 张图片',
-        'image_preview_failed': '预览失败',
-        'no_images_selected': '未选择图片',
-    },
-
-    'EN': {
-        # Window titles
-        'window_title': '💬 Feedback Collector',
-        'image_picker_title': '🖼️ Select Image',
-
-        # Card titles
-        'text_feedback_title': '📝 Text Feedback',
-        'image_feedback_title': '🖼️ Image Feedback',
-        'auto_append_title': '⚙️ Automatic Append Settings',
-
-        # Button text
-        'submit_button': 'Submit Feedback',
-        'cancel_button': 'Cancel',
-        'select_image_button': 'Select Image',
-        'paste_image_button': 'Paste Image',
-        'clear_images_button': 'Clear Images',
-        'select_file_button': 'Select File',
-        'paste_clipboard_button': 'Paste Clipboard',
-
-        # Checkbox text
-        'auto_append_checkbox': 'Automatically Append Feedback Collector Prompt',
-        'auto_append_content': 'The following are the 2 points you must pay attention to:\n1. Process (or answer) the above user feedback.\n2. After processing (or answering) the above user feedback, you must re-call <feedback-collector.collect_feedback> MCP to get user feedback',
-
-        # Placeholder text
-        'text_placeholder': 'Please enter your feedback, suggestions or questions here...',
-
-        # Info messages
-        'shortcut_info': '⌨️ Shortcuts: ⌘+Enter (Ctrl+Enter) to submit, ESC to cancel',
-        'timeout_info': '⏰ Dialog will close automatically in {} minutes',
-        'image_picker_info': 'Select image file or paste from clipboard',
-
-        # Error and status messages
-        'no_feedback_error': 'Please enter text feedback or add images',
-        'submit_success': 'Feedback submitted successfully!',
-        'operation_cancelled': 'Operation cancelled',
-        'timeout_error': 'Operation timeout ({}s), please try again',
-        'gui_error': 'Failed to create feedback dialog: {}',
-        'image_select_cancelled': 'No image selected or operation cancelled',
-        'image_select_failed': 'Image selection failed: {}',
-        'image_info_failed': 'Failed to get image info: {}',
-        'paste_failed': 'Paste failed, no image data in clipboard',
-        'file_not_found': 'File not found: {}',
-        'invalid_image': 'Invalid image file: {}',
-
-        # Confirmation dialogs
-        'confirm_title': 'Confirm',
-        'confirm_cancel': 'Are you sure you want to cancel? All entered content will be lost.',
-        'confirm_clear_images': 'Are you sure you want to clear all images?',
-
-        # Server messages
-        'server_starting': 'Starting MCP Feedback Collector Server...',
-        'server_stopped': 'Server stopped',
-        'server_start_failed': 'Server startup failed: {}',
-        'env_validation_failed': 'Environment validation failed: {}',
-        'env_validation_passed': 'Environment validation passed, starting server...',
-        'feedback_submit_failed': 'Feedback submission failed: {}',
-        'feedback_cancelled': 'User cancelled feedback submission',
-        'collect_feedback_error': 'collect_feedback error: {}',
-        'feedback_collection_failed': 'Feedback collection failed: {}',
-        'pick_image_error': 'pick_image error: {}',
-        'user_text_feedback': 'User text feedback: {}',
-
-        # Debug info
-        'debug_collecting_feedback': 'Starting feedback collection, timeout: {}s',
-        'debug_gui_validated': 'GUI environment validation passed',
-        'debug_feedback_success': 'Feedback collection successful',
-        'debug_feedback_items': 'Returning {} feedback items',
-        'debug_selecting_image': 'Starting image selection',
-        'debug_image_success': 'Image selection successful',
-        'debug_getting_image_info': 'Getting image info: {}',
-        'debug_image_info_success': 'Image info retrieval successful',
-
-        # Image related
-        'image_remove_tooltip': 'Click to remove image',
-        'image_preview': 'Image Preview',
-        'images_count': '{} images added',
-        'image_preview_failed': 'Preview failed',
-        'no_images_selected': 'No images selected',
-    }
-}
+# 语言包目录（每种语言一个 JSON 文件，如 cn.json）
+_CATALOG_PATH = Path(__file__).with_name('translations')
+
+# 支持的语言
+AVAILABLE_LANGUAGES: Tuple[str, ...] = ('CN', 'EN')
+
+# 只有一个 {} 占位符的文本模板（前后缀中不含花括号）
+_SINGLE_PLACEHOLDER = re.compile(r'([^{}]*)\{\}([^{}]*)')
+
+
+def _load(language: str) -> Dict[str, str]:
+    """
+    加载指定语言的语言包
+
+    Args:
+        language: 语言代码
+
+    Returns:
+        键 -> 文本 映射
+    """
+    source = _CATALOG_PATH / f'{language.lower()}.json'
+    with source.open('r', encoding='utf-8') as f:
+        # 驻留所有键和文本，查询时键比较可直接命中同一对象
+        return {sys.intern(key): sys.intern(value)
+                for key, value in json.load(f).items()}
+
+
+class _Catalogs(dict):
+    """按需加载的语言包集合：首次访问某种语言时才读取对应文件"""
+
+    def __missing__(self, language):
+        if language not in AVAILABLE_LANGUAGES:
+            raise KeyError(language)
+        translations = self[language] = MappingProxyType(_load(language))
+        return translations
+
+    def __contains__(self, language):
+        return language in AVAILABLE_LANGUAGES
+
+    def get(self, language, default=None):
+        return self[language] if language in self else default
+
+
+# 语言包（只读，各语言的映射同样只读）
+TRANSLATIONS = MappingProxyType(_Catalogs())
+
+
+def _single_formatter(prefix: str, suffix: str):
+    """生成只有一个 {} 占位符的模板的格式化函数（多余参数忽略，与 str.format 一致）"""
+    return lambda value, *_: f'{prefix}{value}{suffix}'
+
+
+def _compile_catalog(translations: Dict[str, str]) -> Dict[str, Any]:
+    """
+    预编译语言包：带占位符的文本存为 (格式化函数, 原始模板)，其余保持原字符串
+
+    单个 {} 占位符的模板编译为 f-string 闭包，其余模板使用绑定的 str.format 方法
+
+    Args:
+        translations: 单个语言的 键 -> 文本 映射
+
+    Returns:
+        键 -> 字符串或 (格式化函数, 原始模板) 的映射
+    """
+    compiled = {}
+    for key, value in translations.items():
+        if '{' not in value:
+            compiled[key] = value
+            continue
+
+        match = _SINGLE_PLACEHOLDER.fullmatch(value)
+        if match:
+            compiled[key] = (_single_formatter(*match.groups()), value)
+        else:
+            compiled[key] = (value.format, value)
+    return compiled
+
+
+def _resolve_language(language: str) -> Dict[str, Any]:
+    """
+    生成指定语言的 键 -> 预编译文本 映射（缺失的键使用默认语言）
+
+    Args:
+        language: 语言代码
+
+    Returns:
+        已合并默认语言回退的映射
+    """
+    fallback = _compile_catalog(TRANSLATIONS[DEFAULT_LANGUAGE])
+    if language == DEFAULT_LANGUAGE or language not in TRANSLATIONS:
+        return fallback
+
+    active = _compile_catalog(TRANSLATIONS[language])
+    # 按 ChainMap 的查找顺序展开为普通字典：ChainMap 的 __getitem__ 为纯 Python 实现，
+    # 直接用它查询反而比单个字典慢
+    return dict(ChainMap(active, fallback))
+
+
+# 当前语言的文本表（键 -> 文本，带占位符的键存原始模板）与
+# 格式化函数表（键 -> 格式化函数），首次获取文本时生成，切换语言时重建
+_LITERALS = None
+_FORMATTERS: Dict[str, Any] = {}
+
+
+def _activate() -> Dict[str, str]:
+    """
+    按当前语言生成文本表与格式化函数表
+
+    Returns:
+        当前语言的文本表
+    """
+    global _LITERALS, _FORMATTERS
+    literals = {}
+    formatters = {}
+    for key, entry in _resolve_language(CURRENT_LANGUAGE).items():
+        if entry.__class__ is str:
+            literals[key] = entry
+        else:
+            formatters[key], literals[key] = entry
+
+    # 先更新格式化函数表，读取到新文本表时格式化函数表已就绪
+    _FORMATTERS = formatters
+    _LITERALS = literals
+    return literals
 
 
 def get_text(key: str, *args) -> str:
@@ -188,23 +156,18 @@ def get_text(key: str, *args) -> str:
     Returns:
         本地化后的文本
     """
-    # 获取当前语言的翻译
-    current_translations = TRANSLATIONS.get(
-        CURRENT_LANGUAGE, TRANSLATIONS[DEFAULT_LANGUAGE])
-
-    # 获取文本，如果不存在则使用默认语言
-    text = current_translations.get(key)
-    if text is None:
-        text = TRANSLATIONS[DEFAULT_LANGUAGE].get(key, key)
+    literals = _LITERALS or _activate()
 
-    # 格式化文本
+    # 只有带参数且存在占位符时才需要格式化，格式化失败时返回原始模板
     if args:
-        try:
-            return text.format(*args)
-        except (IndexError, ValueError):
-            return text
+        format_text = _FORMATTERS.get(key)
+        if format_text is not None:
+            try:
+                return format_text(*args)
+            except (IndexError, ValueError):
+                pass
 
-    return text
+    return literals.get(key, key)
 
 
 def set_language(language: str):
@@ -214,24 +177,27 @@ def set_language(language: str):
     Args:
         language: 语言代码 ('CN' 或 'EN')
     """
-    global CURRENT_LANGUAGE
+    global CURRENT_LANGUAGE, _LITERALS
     language = language.upper()
     if language in TRANSLATIONS:
-        CURRENT_LANGUAGE = language
-        # 同时更新环境变量
-        os.environ['LANGUAGE'] = language
+        if language != CURRENT_LANGUAGE:
+            CURRENT_LANGUAGE = language
+            _LITERALS = None
+        # 同时更新环境变量（写入会调用 putenv，值未变化时跳过）
+        if os.environ.get('LANGUAGE') != language:
+            os.environ['LANGUAGE'] = language
 
 
 def get_current_language() -> str:
-    """获取当前语言"""
+    """获取当前语言（已弃用，请直接读取 i18n.CURRENT_LANGUAGE）"""
     return CURRENT_LANGUAGE
 
 
-def get_available_languages() -> list:
-    """获取可用的语言列表"""
-    return list(TRANSLATIONS.keys())
+def get_available_languages() -> Tuple[str, ...]:
+    """获取可用的语言列表（共享的只读元组，即 AVAILABLE_LANGUAGES）"""
+    return AVAILABLE_LANGUAGES
 
 
-# 初始化时打印当前语言设置
-if __name__ != "__main__":
-    print(f"[I18N] Current language: {CURRENT_LANGUAGE}", file=sys.stderr)
+# 调试模式下打印当前语言设置
+if os.getenv('FEEDBACK_COLLECTOR_DEBUG'):
+    sys.stderr.write(f"[I18N] Current language: {CURRENT_LANGUAGE}\n")
@@ -6,32 +6,47 @@
 import sys
 import os
 
-# 添加项目根目录到路径
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-from src.ui.feedback_dialog import ModernFeedbackDialog
+# 添加项目根目录到路径（已存在时不重复插入）
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 def main():
     """主函数"""
     print("启动反馈收集器界面测试...")
+
+    # 可选参数：连续显示的次数，用于测试同一个对话框的复用
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    dialog = None
     
     try:
-        # 创建对话框
+        # 仅在实际运行时导入界面模块
+        from src.ui.feedback_dialog import ModernFeedbackDialog
+
+        # 创建对话框（所有轮次共用同一个实例）
         dialog = ModernFeedbackDialog(timeout_seconds=0)  # 无超时
         
-        # 显示界面
-        result = dialog.show_dialog()
-        
-        # 打印结果
-        if result:
-            print(f"反馈结果: {result}")
-        else:
-            print("用户取消了反馈")
+        for index in range(rounds):
+            if rounds > 1:
+                print(f"第 {index + 1}/{rounds} 次显示")
+
+            # 显示界面
+            result = dialog.show_dialog()
+            
+            # 打印结果
+            if result:
+                print(f"反馈结果: {result}")
+            else:
+                print("用户取消了反馈")
             
     except Exception as e:
         print(f"启动界面失败: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        # 释放窗口资源
+        if dialog:
+            dialog.destroy()
 
 if __name__ == "__main__":
     main()